@@ -142,8 +142,10 @@ def settings_from_dict(d: Optional[Dict[str, Any]]) -> ForecastingSettings:
     for field_name in ForecastingSettings.__dataclass_fields__:
         if field_name in d:
             val = d[field_name]
-            if isinstance(val, (int, float)) and math.isfinite(val):
-                kwargs[field_name] = float(val)
+            if isinstance(val, (int, float)):
+                f = float(val)
+                if math.isfinite(f):
+                    kwargs[field_name] = f
     return ForecastingSettings(**kwargs)
 
 
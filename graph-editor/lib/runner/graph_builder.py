@@ -439,7 +439,7 @@ def find_entry_nodes(G: nx.DiGraph) -> list[str]:
         return explicit_entries
     
     # Fall back to nodes with no predecessors
-    return [n for n in G.nodes() if G.in_degree(n) == 0]
+    return [n for n, degree in G.in_degree() if degree == 0]
 
 
 def find_absorbing_nodes(G: nx.DiGraph) -> list[str]:
@@ -450,7 +450,7 @@ def find_absorbing_nodes(G: nx.DiGraph) -> list[str]:
         return explicit_absorbing
     
     # Fall back to nodes with no successors
-    return [n for n in G.nodes() if G.out_degree(n) == 0]
+    return [n for n, degree in G.out_degree() if degree == 0]
 
 
 def resolve_node_id(G: nx.DiGraph, node_ref: str) -> Optional[str]:
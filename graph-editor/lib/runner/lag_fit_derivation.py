@@ -23,7 +23,9 @@ import math
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional
 
-from .lag_distribution_utils import log_normal_cdf, log_normal_inverse_cdf
+import numpy as np
+
+from .lag_distribution_utils import log_normal_cdf_array, log_normal_inverse_cdf
 from .lag_model_fitter import fit_model_from_evidence, select_latest_evidence
 from .forecasting_settings import ForecastingSettings
 
@@ -124,11 +126,12 @@ def derive_lag_fit(
 
     # 3. Build fitted CDF/PMF curve
     t_max = max(int(math.ceil(t95 * 1.5)), 30)
+    t_grid = np.arange(t_max + 1, dtype=np.float64)
+    cdfs = log_normal_cdf_array(np.maximum(0.0, t_grid - onset), mu, sigma)
+    # PDF at t is CDF(t) - CDF(t - 1); CDF(-1) contributes 0.
+    pdfs = np.diff(cdfs, prepend=0.0)
     curve_rows: List[Dict[str, Any]] = []
-    for t in range(t_max + 1):
-        cdf = log_normal_cdf(max(0, t - onset), mu, sigma)
-        cdf_prev = log_normal_cdf(max(0, t - 1 - onset), mu, sigma) if t > 0 else 0.0
-        pdf = cdf - cdf_prev
+    for t, cdf, pdf in zip(range(t_max + 1), cdfs.tolist(), pdfs.tolist()):
         curve_rows.append({
             'row_type': 'curve',
             't': t,
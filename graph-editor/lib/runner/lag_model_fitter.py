@@ -12,15 +12,20 @@ See analysis-forecasting.md §4.6 for what data the fitter needs.
 
 import math
 from dataclasses import dataclass
-from datetime import date, datetime, time
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from slice_key_normalisation import normalise_slice_key_for_matching
 
 from .lag_distribution_utils import (
+    erf,
     fit_lag_distribution,
-    log_normal_cdf,
+    fit_lag_distribution_batch,
     log_normal_inverse_cdf,
+    standard_normal_inverse_cdf,
     to_model_space_lag_days,
     LagDistributionFit,
 )
@@ -31,7 +36,7 @@ from .forecasting_settings import ForecastingSettings
 # Result type
 # ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class FitResult:
     """Result of fitting a lag model from snapshot evidence."""
 
@@ -60,8 +65,17 @@ class FitResult:
 # ─────────────────────────────────────────────────────────────
 
 def _int_or_zero(v: Any) -> int:
+    # DB rows are almost always int/float already; only fall back to the
+    # exception-guarded conversion for strings and other oddities.
+    if v is None:
+        return 0
+    t = type(v)
+    if t is int:
+        return v
+    if t is float:
+        return int(v) if math.isfinite(v) else 0
     try:
-        return int(v) if v is not None else 0
+        return int(v)
     except (ValueError, TypeError):
         return 0
 
@@ -69,6 +83,11 @@ def _int_or_zero(v: Any) -> int:
 def _float_or_none(v: Any) -> Optional[float]:
     if v is None:
         return None
+    t = type(v)
+    if t is float:
+        return v if math.isfinite(v) else None
+    if t is int:
+        return float(v)
     try:
         f = float(v)
         return f if math.isfinite(f) else None
@@ -97,7 +116,35 @@ def _get_y(row: Dict) -> int:
     return _int_or_zero(row.get('y') or row.get('Y'))
 
 
-@dataclass
+# Rows repeat a handful of slice keys many times over (and across fits in a sweep);
+# normalise each distinct key once per process.
+_normalise_slice_key = lru_cache(maxsize=4096)(normalise_slice_key_for_matching)
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# Sorts below every real timestamp so unparseable retrieved_at values never win.
+_UNPARSEABLE_RETRIEVED_AT_US = -(1 << 62)
+
+
+@lru_cache(maxsize=65536)
+def _retrieved_at_epoch_us(ra: str) -> int:
+    """
+    Parse an ISO retrieved_at string to integer epoch microseconds.
+
+    Naive timestamps are treated as UTC. Snapshot rows repeat the same
+    retrieved_at for every anchor_day in a retrieval, hence the cache.
+    """
+    s = ra[:-1] + '+00:00' if ra.endswith('Z') else ra
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return _UNPARSEABLE_RETRIEVED_AT_US
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH_UTC) // _ONE_MICROSECOND
+
+
+@dataclass(slots=True)
 class _EvidenceRow:
     """One row of evidence after selection (latest per anchor_day, aggregated across slices)."""
     anchor_day: str  # ISO date
@@ -107,6 +154,7 @@ class _EvidenceRow:
     mean_lag_days: Optional[float]
     onset_delta_days: Optional[float]
     retrieved_at: str  # ISO datetime
+    anchor_ordinal: Optional[int]  # date.toordinal() of anchor_day; None if unparseable
 
 
 def select_latest_evidence(
@@ -128,67 +176,109 @@ def select_latest_evidence(
     # Snapshot reads match slice_keys by *normalised* slice family (window()/cohort() args stripped),
     # so the selection policy must also de-duplicate across those same families. Otherwise, historic
     # argument variants can double-count evidence for the same logical slice.
-    best: Dict[tuple, Dict] = {}  # (anchor_day, slice_family_key) -> row
+    #
+    # retrieved_at is compared as parsed epoch microseconds rather than as strings, so mixed
+    # ISO spellings ('Z' vs '+00:00', fractional seconds) order correctly.
+    #
+    # Rows are grouped straight into anchor_day -> slice_family_key so the per-anchor aggregation
+    # below needs no second grouping pass. Per-slice X/Y/moments are not kept as running sums:
+    # the day median is a mixture median, which cannot be decremented when a newer row replaces
+    # an older one, so aggregation runs once per anchor over the surviving rows.
+    by_anchor: Dict[str, Dict[str, tuple]] = {}  # anchor_day -> slice_family_key -> (retrieved_at_us, row)
 
     for row in rows:
-        anchor = str(row.get('anchor_day', ''))
+        get = row.get
+        # DB rows already carry str values; only stringify other types (e.g. date/datetime).
+        anchor = get('anchor_day', '')
+        if type(anchor) is not str:
+            anchor = str(anchor)
         if not anchor:
             continue
-        sk = str(row.get('slice_key', ''))
-        sk_norm = normalise_slice_key_for_matching(sk)
-        ra = str(row.get('retrieved_at', ''))
+        ra = get('retrieved_at', '')
+        if type(ra) is not str:
+            ra = str(ra)
         if not ra:
             continue
+        sk = get('slice_key', '')
+        sk_norm = _normalise_slice_key(sk if type(sk) is str else str(sk))
 
-        key = (anchor, sk_norm)
-        if key not in best or ra > best[key].get('retrieved_at', ''):
-            best[key] = row
+        ts = _retrieved_at_epoch_us(ra)
+        slices = by_anchor.get(anchor)
+        if slices is None:
+            by_anchor[anchor] = {sk_norm: (ts, row)}
+            continue
+        prev = slices.get(sk_norm)
+        if prev is None or ts > prev[0]:
+            slices[sk_norm] = (ts, row)
 
     # Now aggregate across slice_keys per anchor_day.
-    by_anchor: Dict[str, List[Dict]] = {}
-    for (anchor, _sk), row in best.items():
-        by_anchor.setdefault(anchor, []).append(row)
-
     result: List[_EvidenceRow] = []
     for anchor in sorted(by_anchor.keys()):
-        slice_rows = by_anchor[anchor]
-        total_x = sum(_get_x(r) for r in slice_rows)
-        total_y = sum(_get_y(r) for r in slice_rows)
-
-        # FE parity: when aggregating across MECE slice families for the same anchor_day,
-        # the *median* is a mixture median (not an average of medians).
-        #
-        # FE: aggregateCohortData() uses mixtureLogNormalMedian(comps, weight=k) per day.
-        # BE: replicate by building a lognormal mixture over per-slice (median, mean) moments.
-        mixture_components: List[Dict[str, Any]] = []
-        w_mean_num = 0.0
-        w_mean_denom = 0.0
-        w_onset_num = 0.0
-        w_onset_denom = 0.0
-        for r in slice_rows:
-            y = _get_y(r)
-            if y <= 0:
-                continue
-            med = _positive_float_or_none(r.get('median_lag_days'))
-            mn = _positive_float_or_none(r.get('mean_lag_days'))
-            onset = _float_or_none(r.get('onset_delta_days'))
-            if med is not None:
-                mixture_components.append({"weight": float(y), "median_days": float(med), "mean_days": float(mn) if mn is not None else None})
-
-            # FE parity: per-anchor-day mean across slices is conversion-weighted mean of means,
-            # with NO per-slice fallback to median. If no slice has a mean, the day mean is None
-            # and later aggregation across anchor days falls back to the day median.
-            if mn is not None:
-                w_mean_num += mn * y
-                w_mean_denom += y
-            if onset is not None:
-                w_onset_num += onset * y
-                w_onset_denom += y
-
-        agg_median = _mixture_log_normal_quantile(0.5, mixture_components) if mixture_components else None
-        agg_mean = (w_mean_num / w_mean_denom) if w_mean_denom > 0 else None
-        agg_onset = (w_onset_num / w_onset_denom) if w_onset_denom > 0 else None
-        latest_ra = max(str(r.get('retrieved_at', '')) for r in slice_rows)
+        entries = list(by_anchor[anchor].values())
+        if len(entries) == 1:
+            # Single slice family (the common non-MECE case): the conversion-weighted means
+            # and the one-component mixture median reduce to the row's own moments.
+            latest_row = entries[0][1]
+            total_x = _get_x(latest_row)
+            total_y = _get_y(latest_row)
+            if total_y > 0:
+                agg_median = _positive_float_or_none(latest_row.get('median_lag_days'))
+                agg_mean = _positive_float_or_none(latest_row.get('mean_lag_days'))
+                agg_onset = _float_or_none(latest_row.get('onset_delta_days'))
+            else:
+                agg_median = agg_mean = agg_onset = None
+        else:
+            total_x = 0
+            total_y = 0
+            latest_ts, latest_row = entries[0]
+
+            # FE parity: when aggregating across MECE slice families for the same anchor_day,
+            # the *median* is a mixture median (not an average of medians).
+            #
+            # FE: aggregateCohortData() uses mixtureLogNormalMedian(comps, weight=k) per day.
+            # BE: replicate by building a lognormal mixture over per-slice (median, mean) moments.
+            mixture_components: List[Tuple[float, float, Optional[float]]] = []  # (weight, median, mean)
+            w_mean_num = 0.0
+            w_mean_denom = 0.0
+            w_onset_num = 0.0
+            w_onset_denom = 0.0
+            # One pass over the surviving rows: each field is extracted once.
+            for ts, r in entries:
+                if ts > latest_ts:
+                    latest_ts, latest_row = ts, r
+                y = _get_y(r)
+                total_x += _get_x(r)
+                total_y += y
+                if y <= 0:
+                    continue
+                med = _positive_float_or_none(r.get('median_lag_days'))
+                mn = _positive_float_or_none(r.get('mean_lag_days'))
+                onset = _float_or_none(r.get('onset_delta_days'))
+                if med is not None:
+                    # Already parsed and validated (y > 0, med > 0): skip the dict round-trip
+                    # and re-validation of the public _mixture_log_normal_quantile entry point.
+                    mixture_components.append((float(y), med, mn))
+
+                # FE parity: per-anchor-day mean across slices is conversion-weighted mean of means,
+                # with NO per-slice fallback to median. If no slice has a mean, the day mean is None
+                # and later aggregation across anchor days falls back to the day median.
+                if mn is not None:
+                    w_mean_num += mn * y
+                    w_mean_denom += y
+                if onset is not None:
+                    w_onset_num += onset * y
+                    w_onset_denom += y
+
+            if len(mixture_components) > 1:
+                agg_median = _mixture_quantile_of_usable(0.5, mixture_components)
+            elif mixture_components:
+                # Only one slice contributed a median: the one-component mixture median is that median.
+                agg_median = mixture_components[0][1]
+            else:
+                agg_median = None
+            agg_mean = (w_mean_num / w_mean_denom) if w_mean_denom > 0 else None
+            agg_onset = (w_onset_num / w_onset_denom) if w_onset_denom > 0 else None
+        latest_ra = str(latest_row.get('retrieved_at', ''))
 
         result.append(_EvidenceRow(
             anchor_day=anchor,
@@ -198,6 +288,7 @@ def select_latest_evidence(
             mean_lag_days=agg_mean,
             onset_delta_days=agg_onset,
             retrieved_at=latest_ra,
+            anchor_ordinal=_parse_date_ordinal(anchor),
         ))
 
     return result
@@ -207,6 +298,33 @@ def select_latest_evidence(
 # Recency-weighted aggregation across anchor days
 # ─────────────────────────────────────────────────────────────
 
+# Below this many mixture components the scalar fit loop beats the fixed
+# NumPy call overhead of fit_lag_distribution_batch.
+_BATCH_FIT_MIN_COMPONENTS = 32
+
+# Mixture quantile root-finding: relative error tolerance and iteration cap (the
+# cap matches the fixed iteration count of the bisection this replaced).
+_MIXTURE_QUANTILE_REL_TOL = 1e-12
+_MIXTURE_QUANTILE_MAX_ITER = 60
+# Component CDFs use the A&S erf (within 7.5e-8 of the exact normal CDF), so the
+# component-quantile bracket is taken at p ∓ this slack to stay a valid bracket.
+_MIXTURE_BRACKET_P_SLACK = 1e-6
+_SQRT2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+@lru_cache(maxsize=8192)
+def _fit_mixture_component(median: float, mean: Optional[float], k_for_fit: int) -> Tuple[float, float]:
+    """
+    (mu, sigma) of fit_lag_distribution for one mixture component, cached.
+
+    The same slice moments recur across anchor days and across fits in a sweep.
+    Keys are the exact floats, so cached and fresh fits are identical.
+    """
+    fit = fit_lag_distribution(median, mean, k_for_fit)
+    return fit.mu, fit.sigma
+
+
 def _mixture_log_normal_quantile(percentile: float, components: List[Dict[str, Any]]) -> Optional[float]:
     """
     FE parity: mixture quantiles for MECE union.
@@ -221,32 +339,52 @@ def _mixture_log_normal_quantile(percentile: float, components: List[Dict[str, A
     if not (0.0 < percentile < 1.0):
         return None
 
-    usable = []
+    usable: List[Tuple[float, float, Optional[float]]] = []
     for c in components:
         w = _float_or_none(c.get("weight"))
         med = _positive_float_or_none(c.get("median_days"))
         if w is None or not (w > 0) or med is None:
             continue
-        mean = _positive_float_or_none(c.get("mean_days"))
-        usable.append({"w": float(w), "median": float(med), "mean": float(mean) if mean is not None else None})
+        usable.append((float(w), float(med), _positive_float_or_none(c.get("mean_days"))))
 
     if not usable:
         return None
+    return _mixture_quantile_of_usable(percentile, usable)
+
 
+def _mixture_quantile_of_usable(
+    percentile: float,
+    usable: List[Tuple[float, float, Optional[float]]],
+) -> Optional[float]:
+    """
+    Mixture quantile over already-validated components.
+
+    usable: non-empty [(weight > 0, median > 0, mean > 0 or None), ...];
+    percentile must lie in (0, 1).
+    """
     if len(usable) == 1 and percentile == 0.5:
-        return usable[0]["median"]
+        return usable[0][1]
 
-    total_w = sum(u["w"] for u in usable)
+    total_w = sum(u[0] for u in usable)
     if not (total_w > 0):
         return None
 
+    # FE parity: quality gate for component fit uses floor(weight) (>=1).
+    # This intentionally forces small components to use default sigma conservatively.
     fitted = []
-    for u in usable:
-        # FE parity: quality gate for component fit uses floor(weight) (>=1).
-        # This intentionally forces small components to use default sigma conservatively.
-        k_for_fit = max(1, int(math.floor(u["w"])))
-        fit = fit_lag_distribution(u["median"], u["mean"], k_for_fit)
-        fitted.append({"w": u["w"], "mu": fit.mu, "sigma": fit.sigma, "median": u["median"]})
+    if len(usable) >= _BATCH_FIT_MIN_COMPONENTS:
+        batch = fit_lag_distribution_batch(
+            [u[1] for u in usable],
+            [u[2] for u in usable],
+            [max(1, int(math.floor(u[0]))) for u in usable],
+        )
+        for (w, median, _mean), mu, sigma in zip(usable, batch.mu.tolist(), batch.sigma.tolist()):
+            fitted.append({"w": w, "mu": mu, "sigma": sigma, "median": median})
+    else:
+        for w, median, mean in usable:
+            k_for_fit = max(1, int(math.floor(w)))
+            mu, sigma = _fit_mixture_component(median, mean, k_for_fit)
+            fitted.append({"w": w, "mu": mu, "sigma": sigma, "median": median})
 
     min_median = min(f["median"] for f in fitted)
     max_median = max(f["median"] for f in fitted)
@@ -254,47 +392,172 @@ def _mixture_log_normal_quantile(percentile: float, components: List[Dict[str, A
     lo = max(min_median / 100.0, 1e-6)
     hi = max(max_median * 100.0, lo * 2.0)
 
-    def mixture_cdf(t: float) -> float:
-        s = 0.0
-        for f in fitted:
-            s += f["w"] * log_normal_cdf(t, f["mu"], f["sigma"])
-        return s / total_w
-
-    # Expand hi if needed (rare).
-    for _ in range(8):
-        if mixture_cdf(hi) >= percentile:
-            break
-        hi *= 2.0
-
-    # Binary search.
-    for _ in range(60):
-        mid = (lo + hi) / 2.0
-        cdf = mixture_cdf(mid)
-        if cdf >= percentile:
-            hi = mid
+    # Results are confined to [lo, hi·256] (the TS port expands hi by doubling at most 8 times).
+    hi *= 256.0
+
+    # Every component CDF is < p at the smallest component quantile of p - slack and
+    # > p at the largest of p + slack, so the mixture quantile lies between them: a
+    # bracket without probing the mixture CDF. With one component this is already a
+    # tight bracket, and the root-finder below lands on the FE bisection's answer.
+    p_lo = percentile - _MIXTURE_BRACKET_P_SLACK
+    p_hi = percentile + _MIXTURE_BRACKET_P_SLACK
+    z_lo = standard_normal_inverse_cdf(p_lo) if p_lo > 0.0 else None
+    z_hi = standard_normal_inverse_cdf(p_hi) if p_hi < 1.0 else None
+    q_min = math.inf if z_lo is not None else 0.0
+    q_max = 0.0 if z_hi is not None else math.inf
+    for f in fitted:
+        if z_lo is not None:
+            q = math.exp(f["mu"] + f["sigma"] * z_lo)
+            if q < q_min:
+                q_min = q
+        if z_hi is not None:
+            q = math.exp(f["mu"] + f["sigma"] * z_hi)
+            if q > q_max:
+                q_max = q
+    if q_max <= lo:
+        # The FE bisection sees cdf >= p at every midpoint, so it only halves its unexpanded
+        # hi down towards lo; replay those midpoints to return the same value.
+        hi /= 256.0
+        for _ in range(_MIXTURE_QUANTILE_MAX_ITER):
+            hi = 0.5 * (lo + hi)
+        return hi
+    if q_min >= hi:
+        # Likewise the FE bisection, after doubling hi all 8 times, only raises lo.
+        return hi
+    lo = max(lo, q_min)
+    hi = min(hi, q_max)
+    if not (lo < hi):
+        return lo
+
+    # Per-component (w, mu, sigma, w/sigma). The CDF term is exactly the reference
+    # w * log_normal_cdf(t, mu, sigma), summed in the same order and divided by total_w,
+    # so it matches the FE bisection's CDF bit for bit: in the tails one ulp of CDF moves
+    # the quantile by ~1e-10 relative. The density exp(-x²/2) / (t·sigma·√(2π)) is the
+    # exact lognormal one; it only steers Newton, which the bisection fallback keeps safe.
+    comps = [(f["w"], f["mu"], f["sigma"], f["w"] / f["sigma"]) for f in fitted]
+    pdf_scale = 1.0 / (total_w * _SQRT_2PI)
+    exp = math.exp
+    log = math.log
+    sqrt2 = _SQRT2
+
+    def mixture_cdf_pdf(t: float) -> Tuple[float, float]:
+        log_t = log(t)
+        c = 0.0
+        d = 0.0
+        for w, mu, sigma, w_over_sigma in comps:
+            x = (log_t - mu) / sigma
+            c += w * (0.5 * (1.0 + erf(x / sqrt2)))
+            d += w_over_sigma * exp(-0.5 * x * x)
+        return c / total_w, d * pdf_scale / t
+
+    # Safeguarded Newton on cdf(t) - p, seeded at the weighted geometric-mean median.
+    # [lo, hi] stays a bracket of the root; any Newton step that leaves it (or a vanishing
+    # pdf) falls back to bisection, so this never does worse than the plain bisection it
+    # replaces but typically converges in a handful of iterations.
+    t = math.exp(sum(f["w"] * f["mu"] for f in fitted) / total_w)
+    if not (lo < t < hi):
+        t = 0.5 * (lo + hi)
+    for _ in range(_MIXTURE_QUANTILE_MAX_ITER):
+        cdf, pdf = mixture_cdf_pdf(t)
+        above = cdf >= percentile
+        if above:
+            hi = t
         else:
-            lo = mid
+            lo = t
+        t_next = t - (cdf - percentile) / pdf if pdf > 0 else hi
+        if not (lo < t_next < hi):
+            t_next = 0.5 * (lo + hi)
+        step = _MIXTURE_QUANTILE_REL_TOL * t
+        if abs(t_next - t) <= step:
+            # A small step alone does not bound the error: in the tails the A&S CDF is
+            # quantised into flat steps a Newton step only creeps across. Probe one
+            # tolerance past t_next; if the CDF crosses p between t and the probe, t_next
+            # is within the tolerance of the point the FE bisection converges to.
+            # Otherwise t sits on a flat step, so move that end of the bracket and bisect.
+            probe = t_next - step if above else t_next + step
+            if (mixture_cdf_pdf(probe)[0] >= percentile) != above:
+                return t_next
+            if above:
+                hi = probe
+            else:
+                lo = probe
+            if not (lo < hi):
+                return hi
+            t_next = 0.5 * (lo + hi)
+        t = t_next
 
     return hi
 
 
-def _recency_weight(age_days: float, half_life_days: float) -> float:
-    """Exponential decay weight: w = exp(-ln(2) * age / half_life)."""
-    if half_life_days <= 0 or not math.isfinite(half_life_days):
-        return 1.0
-    if not math.isfinite(age_days) or age_days < 0:
-        return 1.0
-    return math.exp(-math.log(2) * age_days / half_life_days)
+_LN2 = math.log(2.0)
+_Z95 = standard_normal_inverse_cdf(0.95)
+
 
+@lru_cache(maxsize=8192)
+def _parse_date_ordinal(s: str) -> Optional[int]:
+    """
+    Parse an ISO date string (YYYY-MM-DD) to a proleptic Gregorian ordinal.
 
-def _parse_date(s: str) -> Optional[date]:
-    """Parse an ISO date string (YYYY-MM-DD) to a date object."""
+    Cached: the same anchor_day strings recur across fits in a sweep, and
+    downstream age / left-censor arithmetic only needs the ordinal.
+    """
     try:
-        return date.fromisoformat(s[:10])
+        return date.fromisoformat(s[:10]).toordinal()
     except (ValueError, TypeError):
         return None
 
 
+def _latest_anchor_ordinal(evidence: List[_EvidenceRow]) -> Optional[int]:
+    """Latest parseable anchor_day ordinal, found in one pass (None if there is none)."""
+    latest = None
+    for e in evidence:
+        o = e.anchor_ordinal
+        if o is not None and (latest is None or o > latest):
+            latest = o
+    return latest
+
+
+def _evidence_to_arrays(
+    evidence: List[_EvidenceRow],
+    ref_ordinal: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column (structure-of-arrays) view of evidence rows for aggregate_evidence.
+
+    Returns (age_days, y, moments) where moments is a 3xN array of
+    (median, mean, onset) with NaN marking missing values.
+    """
+    n = len(evidence)
+    # Whole-day ages as plain ordinal differences, using the ordinal parsed once during
+    # selection. An unparseable anchor_day gets age 0, i.e. it is treated as current.
+    anchor_ordinals = np.fromiter(
+        (ref_ordinal if ev.anchor_ordinal is None else ev.anchor_ordinal for ev in evidence),
+        dtype=np.int64,
+        count=n,
+    )
+    age_days = (ref_ordinal - anchor_ordinals).astype(np.float64)
+    ys = np.fromiter((ev.y for ev in evidence), dtype=np.float64, count=n)
+
+    medians = np.array(
+        [ev.median_lag_days if (ev.median_lag_days is not None and ev.median_lag_days > 0) else np.nan
+         for ev in evidence],
+        dtype=np.float64,
+    )
+    # FE parity: mean falls back to median when missing/zero.
+    # FE code: `wk * (cohort.mean_lag_days || cohort.median_lag_days || 0)`
+    means = np.array(
+        [ev.mean_lag_days if (ev.mean_lag_days is not None and ev.mean_lag_days > 0) else np.nan
+         for ev in evidence],
+        dtype=np.float64,
+    )
+    means = np.where(np.isnan(means), medians, means)
+    onsets = np.array(
+        [ev.onset_delta_days if ev.onset_delta_days is not None else np.nan for ev in evidence],
+        dtype=np.float64,
+    )
+    return age_days, ys, np.stack((medians, means, onsets))
+
+
 def aggregate_evidence(
     evidence: List[_EvidenceRow],
     settings: ForecastingSettings,
@@ -317,53 +580,41 @@ def aggregate_evidence(
     # queryDate and cohortDate (UTC midnight), due to Math.floor(...) usage.
     #
     # Therefore, for parity we derive a reference *date* and use integer day deltas.
-    if reference_date is None:
-        if reference_datetime is not None:
-            reference_date = reference_datetime.date()
-        else:
-            # Use latest anchor_day as reference.
-            dates = [_parse_date(e.anchor_day) for e in evidence]
-            valid_dates = [d for d in dates if d is not None]
-            reference_date = max(valid_dates) if valid_dates else date.today()
-
-    w_median_num = 0.0
-    w_median_denom = 0.0
-    w_mean_num = 0.0
-    w_mean_denom = 0.0
-    w_onset_num = 0.0
-    w_onset_denom = 0.0
-    total_k = 0.0
-    total_k_recency_weighted = 0.0
-
-    for ev in evidence:
-        if ev.y <= 0:
-            continue
-
-        anchor_date = _parse_date(ev.anchor_day)
-        age_days = (reference_date - anchor_date).days if (reference_date and anchor_date) else 0
-        recency_w = _recency_weight(age_days, settings.recency_half_life_days)
-        w = ev.y * recency_w
-
-        if ev.median_lag_days is not None:
-            if ev.median_lag_days > 0:
-                w_median_num += ev.median_lag_days * w
-                w_median_denom += w
-        # FE parity: mean falls back to median when missing/zero.
-        # FE code: `wk * (cohort.mean_lag_days || cohort.median_lag_days || 0)`
-        effective_mean = (
-            ev.mean_lag_days if (ev.mean_lag_days is not None and ev.mean_lag_days > 0)
-            else (ev.median_lag_days if (ev.median_lag_days is not None and ev.median_lag_days > 0) else None)
-        )
-        if effective_mean is not None:
-            w_mean_num += effective_mean * w
-            w_mean_denom += w
-        if ev.onset_delta_days is not None:
-            w_onset_num += ev.onset_delta_days * w
-            w_onset_denom += w
-        total_k += ev.y
-        # FE parity: quality gate uses recency-weighted K, not raw sum.
-        # FE code: `sum(c.k * computeRecencyWeight(c.age, RECENCY_HALF_LIFE_DAYS))`
-        total_k_recency_weighted += ev.y * recency_w
+    if reference_date is not None:
+        ref_ordinal = reference_date.toordinal()
+    elif reference_datetime is not None:
+        ref_ordinal = reference_datetime.date().toordinal()
+    else:
+        # Use latest anchor_day as reference.
+        latest = _latest_anchor_ordinal(evidence)
+        ref_ordinal = latest if latest is not None else date.today().toordinal()
+
+    contributing = [ev for ev in evidence if ev.y > 0]
+    if not contributing:
+        return None, None, 0.0, 0.0, 0.0
+
+    age_days, ys, moments = _evidence_to_arrays(contributing, ref_ordinal)
+
+    # Exponential recency decay w = exp(-ln(2) * age / half_life), computed for
+    # every row in one vectorised pass. A disabled (non-positive / non-finite)
+    # half-life or a negative age gives weight 1.
+    half_life = settings.recency_half_life_days
+    if half_life > 0 and math.isfinite(half_life):
+        w = ys * np.exp(-_LN2 * np.maximum(age_days, 0.0) / half_life)
+    else:
+        w = ys
+
+    # All six weighted sums in two matrix-vector products: rows are (median, mean, onset),
+    # missing values (NaN) contribute zero to the numerator and are masked out of the denominator.
+    present = ~np.isnan(moments)
+    nums = np.where(present, moments, 0.0) @ w
+    denoms = present.astype(np.float64) @ w
+    w_median_num, w_mean_num, w_onset_num = nums.tolist()
+    w_median_denom, w_mean_denom, w_onset_denom = denoms.tolist()
+    total_k = float(ys.sum())
+    # FE parity: quality gate uses recency-weighted K, not raw sum.
+    # FE code: `sum(c.k * computeRecencyWeight(c.age, RECENCY_HALF_LIFE_DAYS))`
+    total_k_recency_weighted = float(w.sum())
 
     agg_median = (w_median_num / w_median_denom) if w_median_denom > 0 else None
     agg_mean = (w_mean_num / w_mean_denom) if w_mean_denom > 0 else None
@@ -408,19 +659,20 @@ def fit_model_from_evidence(
     # Step 1: Select evidence (latest per anchor_day, aggregate across slices).
     evidence = select_latest_evidence(rows)
 
+    # Resolve the reference date once (default: latest anchor_day). It drives both the
+    # left-censor window and recency weighting; censoring never drops the latest anchor,
+    # so aggregate_evidence would arrive at the same default.
+    if reference_date is None and reference_datetime is not None:
+        reference_date = reference_datetime.date()
+    if reference_date is None and evidence:
+        latest = _latest_anchor_ordinal(evidence)
+        reference_date = date.fromordinal(latest) if latest is not None else date.today()
+
     # Step 1b: Left-censor to most recent N days (if configured).
     censor_n = int(settings.fit_left_censor_days) if settings.fit_left_censor_days > 0 else 0
     if censor_n > 0 and evidence:
-        ref = reference_date
-        if ref is None and reference_datetime is not None:
-            ref = reference_datetime.date()
-        if ref is None:
-            valid = [_parse_date(e.anchor_day) for e in evidence]
-            valid = [d for d in valid if d is not None]
-            ref = max(valid) if valid else date.today()
-        from datetime import timedelta
-        min_anchor = ref - timedelta(days=censor_n - 1)
-        evidence = [e for e in evidence if (_parse_date(e.anchor_day) or min_anchor) >= min_anchor]
+        min_ordinal = reference_date.toordinal() - (censor_n - 1)
+        evidence = [e for e in evidence if e.anchor_ordinal is None or e.anchor_ordinal >= min_ordinal]
 
     if not evidence:
         return FitResult(
@@ -483,17 +735,19 @@ def fit_model_from_evidence(
     sigma = initial_fit.sigma
 
     # Step 5: Apply t95 constraint (one-way: can only widen sigma).
+    # median_x is clamped finite and positive, so the fit's mu is exactly
+    # ln(median_x); reuse it rather than taking the log again.
+    log_median_x = mu
     if (
         t95_constraint is not None
         and math.isfinite(t95_constraint)
         and t95_constraint > 0
     ):
         t95_x = to_model_space_lag_days(agg_onset, t95_constraint)
-        if t95_x > 0 and median_x > 0:
-            z = 1.6448536269514729  # standardNormalInverseCDF(0.95) ≈ 1.6449
-            sigma_from_constraint = math.log(t95_x / median_x) / z if t95_x > median_x else 0.0
-            if sigma_from_constraint > sigma:
-                sigma = sigma_from_constraint
+        # The constraint only widens sigma when t95_x exceeds the current fit's own t95
+        # (median_x * exp(z * sigma)); test that first and skip the log otherwise.
+        if t95_x > 0 and median_x > 0 and t95_x > math.exp(log_median_x + _Z95 * sigma):
+            sigma = max(sigma, (math.log(t95_x) - log_median_x) / _Z95)
 
     # Step 6: Derive t95 from final fit.
     # FE parity (graph semantics):
@@ -7,10 +7,21 @@ into a single uncontexted result.
 Used by analytics to combine context-sliced snapshot data.
 """
 
-from collections import defaultdict
 from typing import List, Dict, Any
 
 
+# Slots of the per-anchor_day accumulator list in aggregate_mece_slices.
+_ACC_X = 0
+_ACC_Y = 1
+_ACC_A = 2
+_ACC_HAS_A = 3
+_ACC_MEDIAN_LAG = 4
+_ACC_MEAN_LAG = 5
+_ACC_ANCHOR_MEDIAN_LAG = 6
+_ACC_ANCHOR_MEAN_LAG = 7
+_ACC_LATENCY_WEIGHT = 8
+
+
 def aggregate_mece_slices(slices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Aggregate MECE slices into uncontexted totals.
@@ -31,85 +42,77 @@ def aggregate_mece_slices(slices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not slices:
         return []
     
-    # Group by anchor_day
-    by_day: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        'X': 0,
-        'Y': 0,
-        'A': 0,
-        'has_A': False,
-        # For weighted latency
-        'weighted_median_lag': 0.0,
-        'weighted_mean_lag': 0.0,
-        'weighted_anchor_median_lag': 0.0,
-        'weighted_anchor_mean_lag': 0.0,
-        'latency_weight': 0,  # Sum of X for rows with latency
-    })
+    # Group by anchor_day. Each day accumulates into a flat list (indexed by the
+    # _ACC_* slots above) rather than a dict of named fields: this loop runs once
+    # per snapshot row, and list indexing avoids a string-keyed lookup per field.
+    by_day: Dict[str, List[Any]] = {}
     
     for slice_data in slices:
         for row in slice_data.get('rows', []):
-            anchor_day = row.get('anchor_day')
+            get = row.get
+            anchor_day = get('anchor_day')
             if not anchor_day:
                 continue
             
-            day_data = by_day[anchor_day]
+            acc = by_day.get(anchor_day)
+            if acc is None:
+                acc = by_day[anchor_day] = [0, 0, 0, False, 0.0, 0.0, 0.0, 0.0, 0]
             
             # Sum X and Y
-            x_val = row.get('X', 0) or 0
-            y_val = row.get('Y', 0) or 0
-            day_data['X'] += x_val
-            day_data['Y'] += y_val
+            x_val = get('X') or 0
+            acc[_ACC_X] += x_val
+            acc[_ACC_Y] += get('Y') or 0
             
             # Sum A if present
-            a_val = row.get('A')
+            a_val = get('A')
             if a_val is not None:
-                day_data['A'] += a_val
-                day_data['has_A'] = True
+                acc[_ACC_A] += a_val
+                acc[_ACC_HAS_A] = True
             
             # Weighted latency contribution
-            median_lag = row.get('median_lag_days')
-            mean_lag = row.get('mean_lag_days')
-            anchor_median = row.get('anchor_median_lag_days')
-            anchor_mean = row.get('anchor_mean_lag_days')
+            median_lag = get('median_lag_days')
+            mean_lag = get('mean_lag_days')
             
             if median_lag is not None or mean_lag is not None:
                 weight = x_val if x_val > 0 else 1
-                day_data['latency_weight'] += weight
+                acc[_ACC_LATENCY_WEIGHT] += weight
                 
                 if median_lag is not None:
-                    day_data['weighted_median_lag'] += weight * median_lag
+                    acc[_ACC_MEDIAN_LAG] += weight * median_lag
                 if mean_lag is not None:
-                    day_data['weighted_mean_lag'] += weight * mean_lag
+                    acc[_ACC_MEAN_LAG] += weight * mean_lag
+                anchor_median = get('anchor_median_lag_days')
                 if anchor_median is not None:
-                    day_data['weighted_anchor_median_lag'] += weight * anchor_median
+                    acc[_ACC_ANCHOR_MEDIAN_LAG] += weight * anchor_median
+                anchor_mean = get('anchor_mean_lag_days')
                 if anchor_mean is not None:
-                    day_data['weighted_anchor_mean_lag'] += weight * anchor_mean
+                    acc[_ACC_ANCHOR_MEAN_LAG] += weight * anchor_mean
     
     # Build result
     result = []
     for anchor_day in sorted(by_day.keys()):
-        day_data = by_day[anchor_day]
+        (x_total, y_total, a_total, has_a, weighted_median_lag, weighted_mean_lag,
+         weighted_anchor_median_lag, weighted_anchor_mean_lag, latency_weight) = by_day[anchor_day]
         
         row: Dict[str, Any] = {
             'anchor_day': anchor_day,
-            'X': day_data['X'],
-            'Y': day_data['Y'],
+            'X': x_total,
+            'Y': y_total,
         }
         
-        if day_data['has_A']:
-            row['A'] = day_data['A']
+        if has_a:
+            row['A'] = a_total
         
         # Compute weighted average latency
-        if day_data['latency_weight'] > 0:
-            weight = day_data['latency_weight']
-            
-            if day_data['weighted_median_lag'] > 0:
-                row['median_lag_days'] = day_data['weighted_median_lag'] / weight
-            if day_data['weighted_mean_lag'] > 0:
-                row['mean_lag_days'] = day_data['weighted_mean_lag'] / weight
-            if day_data['weighted_anchor_median_lag'] > 0:
-                row['anchor_median_lag_days'] = day_data['weighted_anchor_median_lag'] / weight
-            if day_data['weighted_anchor_mean_lag'] > 0:
-                row['anchor_mean_lag_days'] = day_data['weighted_anchor_mean_lag'] / weight
+        if latency_weight > 0:
+            if weighted_median_lag > 0:
+                row['median_lag_days'] = weighted_median_lag / latency_weight
+            if weighted_mean_lag > 0:
+                row['mean_lag_days'] = weighted_mean_lag / latency_weight
+            if weighted_anchor_median_lag > 0:
+                row['anchor_median_lag_days'] = weighted_anchor_median_lag / latency_weight
+            if weighted_anchor_mean_lag > 0:
+                row['anchor_mean_lag_days'] = weighted_anchor_mean_lag / latency_weight
         
         result.append(row)
     
@@ -14,10 +14,11 @@ import re
 
 import logging
 
-from .constraint_eval import evaluate_constraint_condition, parse_constraint_condition, constraint_specificity_score
+from .constraint_eval import parse_constraint_condition, constraint_specificity_score
+from .graph_builder import find_absorbing_nodes, find_entry_nodes, get_graph_stats, resolve_node_id
 
 
-@dataclass
+@dataclass(slots=True)
 class PathResult:
     """Result of path probability calculation."""
     probability: float
@@ -31,7 +32,7 @@ class PathResult:
     intermediate_nodes: list[str] = field(default_factory=list)
 
 
-@dataclass 
+@dataclass(slots=True)
 class PruningResult:
     """Result of graph pruning for visited constraints."""
     excluded_edges: set[tuple[str, str]]  # (source, target) tuples
@@ -65,21 +66,67 @@ def _graph_has_conditional_probabilities(G: nx.DiGraph) -> bool:
     return False
 
 
-def _get_tracked_human_ids(G: nx.DiGraph) -> set[str]:
-    tracked: set[str] = set()
+def _get_conditions(G: nx.DiGraph) -> list[Optional[str]]:
+    """Distinct conditional_p condition keys (see _condition_key) across all edges, first seen first."""
+    conditions: dict[Optional[str], None] = {}
     for _, _, data in G.edges(data=True):
         for cp in (data.get('conditional_p') or []):
-            cond = cp.get('condition') if isinstance(cp, dict) else None
-            tracked |= _extract_tracked_human_ids(cond)
-    return tracked
+            if isinstance(cp, dict):
+                conditions[_condition_key(cp.get('condition'))] = None
+    return list(conditions)
+
+
+def _compile_condition(
+    condition: Optional[str],
+    tracked_bit: dict[str, int],
+) -> Optional[tuple[int, int, tuple[int, ...], int]]:
+    """
+    Parse a conditional_p condition once into (visited_mask, exclude_mask, visited_any_masks,
+    specificity_score) over the tracked-id bits, or None if it can never match here.
+
+    Matching a visited bitmask then mirrors evaluate_constraint_condition with no context or
+    case variants, which runner analytics never supply: context(...) / case(...) never match.
+    """
+    try:
+        parsed = parse_constraint_condition(condition)
+    except Exception:
+        # Invalid/unsupported condition DSL: treat as non-match here.
+        # (Any caller that explicitly activates conditional semantics should surface this separately.)
+        logging.getLogger(__name__).warning(
+            "Unsupported or invalid conditional_p condition DSL encountered (treated as non-match): %r", condition
+        )
+        return None
+    if parsed.contexts or parsed.cases:
+        return None
+
+    visited_mask = 0
+    for hid in parsed.visited:
+        visited_mask |= tracked_bit[hid]
+    exclude_mask = 0
+    for hid in parsed.exclude:
+        exclude_mask |= tracked_bit[hid]
+    visited_any_masks = []
+    for group in parsed.visited_any:
+        group_mask = 0
+        for hid in group:
+            group_mask |= tracked_bit[hid]
+        visited_any_masks.append(group_mask)
+    return visited_mask, exclude_mask, tuple(visited_any_masks), constraint_specificity_score(condition)
+
+
+def _condition_key(condition: Any) -> Optional[str]:
+    """Key for compiled conditions; non-string conditions parse as empty, like None."""
+    return condition if isinstance(condition, str) else None
 
 
 def _effective_edge_probability(
     edge_data: dict[str, Any],
-    visited_human_ids: set[str],
+    visited_mask: int,
+    compiled: dict[Optional[str], Optional[tuple[int, int, tuple[int, ...], int]]],
 ) -> float:
     """
-    Pick edge probability accounting for conditional_p (visited(...) only for now).
+    Pick edge probability accounting for conditional_p, given the visited tracked-id bitmask
+    and the graph's conditions compiled by _compile_condition.
     If multiple conditions match, first match wins (mirrors TS runner behaviour).
     """
     cps = edge_data.get('conditional_p') or []
@@ -89,47 +136,31 @@ def _effective_edge_probability(
         for cp in cps:
             if not isinstance(cp, dict):
                 continue
-            cond = cp.get('condition')
-            try:
-                matches = evaluate_constraint_condition(cond, visited_nodes=visited_human_ids)
-            except Exception:
-                # Invalid/unsupported condition DSL: treat as non-match here.
-                # (Any caller that explicitly activates conditional semantics should surface this separately.)
-                logging.getLogger(__name__).warning(
-                    "Unsupported or invalid conditional_p condition DSL encountered (treated as non-match): %r", cond
-                )
-                matches = False
-            if matches:
-                p = cp.get('p') or {}
-                if isinstance(p, dict):
-                    pv = float(p.get('mean') or 0.0)
-                elif isinstance(p, (int, float)):
-                    pv = float(p)
-                else:
-                    pv = 0.0
-
-                try:
-                    score = constraint_specificity_score(cond)
-                except Exception:
-                    score = 0
+            matcher = compiled[_condition_key(cp.get('condition'))]
+            if matcher is None:
+                continue
+            required, excluded, any_of, score = matcher
+            if (visited_mask & required) != required or visited_mask & excluded:
+                continue
+            if any_of and not any(visited_mask & group for group in any_of):
+                continue
 
-                if best_score is None or score > best_score:
-                    best_score = score
-                    best_p = pv
+            p = cp.get('p') or {}
+            if isinstance(p, dict):
+                pv = float(p.get('mean') or 0.0)
+            elif isinstance(p, (int, float)):
+                pv = float(p)
+            else:
+                pv = 0.0
+
+            if best_score is None or score > best_score:
+                best_score = score
+                best_p = pv
         if best_p is not None:
             return best_p
     return float(edge_data.get('p') or 0.0)
 
 
-def _is_terminal_for_target(G: nx.DiGraph, node_key: str, target_key: str) -> bool:
-    """Stop propagation once we hit the target, or any node with no outgoing edges."""
-    if node_key == target_key:
-        return True
-    if G.out_degree(node_key) == 0:
-        return True
-    return False
-
-
 def _calculate_path_probability_state_space(
     G: nx.DiGraph,
     start_key: str,
@@ -139,23 +170,30 @@ def _calculate_path_probability_state_space(
     """
     State-space expansion for graphs with conditional_p.
 
-    State = (node_key, visited_tracked_human_ids_subset).
+    State = (node_key, visited_tracked_human_ids_subset), with the subset packed into an int
+    bitmask (bit i set = i-th tracked id visited) so state keys hash as plain ints.
     """
     excluded = pruning.excluded_edges if pruning else set()
     renorm = pruning.renorm_factors if pruning else {}
 
-    tracked = _get_tracked_human_ids(G)
-
-    # state key serialisation
-    def sk(node: str, visited: frozenset[str]) -> tuple[str, frozenset[str]]:
-        return (node, visited)
+    # One scan of the edges; each distinct condition is then parsed for its tracked ids and
+    # compiled once, not once per occurrence or per (state, edge) expansion.
+    conditions = _get_conditions(G)
+    tracked: set[str] = set()
+    for condition in conditions:
+        tracked |= _extract_tracked_human_ids(condition)
+    tracked_bit = {hid: 1 << i for i, hid in enumerate(sorted(tracked))}
+    compiled = {condition: _compile_condition(condition, tracked_bit) for condition in conditions}
 
-    states: dict[tuple[str, frozenset[str]], float] = {}
-    costs: dict[tuple[str, frozenset[str]], tuple[float, float]] = {}
+    states: dict[tuple[str, int], float] = {}
+    costs: dict[tuple[str, int], tuple[float, float]] = {}
 
-    init = sk(start_key, frozenset())
+    init = (start_key, 0)
     states[init] = 1.0
     costs[init] = (0.0, 0.0)
+    # State keys bucketed by node, in creation order, so a node finds its states without a
+    # scan of every state.
+    keys_by_node: dict[str, list[tuple[str, int]]] = {start_key: [init]}
 
     # Process in topological order of nodes (graph is assumed DAG-ish; cycles treated as terminal-ish).
     try:
@@ -163,34 +201,36 @@ def _calculate_path_probability_state_space(
     except Exception:
         topo = list(G.nodes)
 
+    succ = G.succ
+    # Stop propagation once we hit the target, or any node with no outgoing edges.
+    is_terminal = {n: n == end_key or not succ[n] for n in succ}
+
     # Expand node-by-node; for each node, repeatedly expand any states currently at that node.
     for node_key in topo:
+        if is_terminal[node_key]:
+            continue
+
+        # When leaving this node, mark it as visited if it is tracked.
+        node_hid = G.nodes[node_key].get('id') or node_key
+        node_bit = tracked_bit.get(node_hid, 0)
+
         # Find all current states at this node (snapshot keys to avoid concurrent modification).
-        node_states = [k for k in list(states.keys()) if k[0] == node_key]
+        node_states = list(keys_by_node.get(node_key, ()))
 
         for state_key in node_states:
             prob = states.get(state_key, 0.0) or 0.0
             if prob == 0:
                 continue
 
-            visited = set(state_key[1])
             cost_gbp, cost_lab = costs.get(state_key, (0.0, 0.0))
+            next_mask = state_key[1] | node_bit
 
-            if _is_terminal_for_target(G, node_key, end_key):
-                continue
-
-            # When leaving this node, mark it as visited if it is tracked.
-            node_hid = G.nodes[node_key].get('id') or node_key
-            next_visited = set(visited)
-            if node_hid in tracked:
-                next_visited.add(node_hid)
-
-            for _, target, data in G.out_edges(node_key, data=True):
+            for target, data in succ[node_key].items():
                 edge = (node_key, target)
                 if edge in excluded:
                     continue
 
-                p = _effective_edge_probability(data, next_visited)
+                p = _effective_edge_probability(data, next_mask, compiled)
                 if edge in renorm:
                     p *= renorm[edge]
                 if p == 0:
@@ -200,9 +240,12 @@ def _calculate_path_probability_state_space(
                 edge_lab = float(data.get('labour_cost') or 0.0)
 
                 w = prob * p
-                next_key = sk(target, frozenset(next_visited))
+                next_key = (target, next_mask)
 
-                prev_prob = states.get(next_key, 0.0) or 0.0
+                prev_prob = states.get(next_key)
+                if prev_prob is None:
+                    keys_by_node.setdefault(target, []).append(next_key)
+                    prev_prob = 0.0
                 new_prob = prev_prob + w
                 states[next_key] = new_prob
 
@@ -219,31 +262,29 @@ def _calculate_path_probability_state_space(
                 else:
                     costs[next_key] = next_cost
 
-    # Aggregate probability + costs at end (across visited states).
-    end_states = [k for k in states.keys() if k[0] == end_key]
-    p_end = sum(states[k] for k in end_states)
-
-    # Unconditional expected cost (per attempt) = expected cost of terminal states.
-    terminal_states = [k for k in states.keys() if _is_terminal_for_target(G, k[0], end_key)]
+    # Aggregate in one pass over the states:
+    # - probability at end (across visited states),
+    # - unconditional expected cost (per attempt) = expected cost of terminal states,
+    # - cost given success = weighted average cost among end states.
+    p_end = 0.0
     exp_cost = 0.0
     exp_lab = 0.0
-    for k in terminal_states:
-        p = states.get(k, 0.0) or 0.0
-        c = costs.get(k, (0.0, 0.0))
+    num_cost = 0.0
+    num_lab = 0.0
+    for k, p in states.items():
+        if not is_terminal.get(k[0]):  # A start key outside G is never terminal
+            continue
+        c = costs[k]
         exp_cost += p * c[0]
         exp_lab += p * c[1]
+        if k[0] == end_key:
+            p_end += p
+            num_cost += p * c[0]
+            num_lab += p * c[1]
 
-    # Cost given success = weighted average cost among end states.
     exp_cost_given = None
     exp_lab_given = None
     if p_end > 0:
-        num_cost = 0.0
-        num_lab = 0.0
-        for k in end_states:
-            p = states.get(k, 0.0) or 0.0
-            c = costs.get(k, (0.0, 0.0))
-            num_cost += p * c[0]
-            num_lab += p * c[1]
         exp_cost_given = num_cost / p_end
         exp_lab_given = num_lab / p_end
 
@@ -277,8 +318,6 @@ def compute_pruning(
     Returns:
         PruningResult with excluded edges and renormalization factors
     """
-    from .graph_builder import resolve_node_id
-    
     excluded_edges = set()
     renorm_factors = {}
     
@@ -301,17 +340,20 @@ def compute_pruning(
         if resolved_group:
             resolved_any_groups.append(resolved_group)
     
+    # Adjacency dicts (child -> edge data, parent -> edge data) are read directly rather
+    # than through G.successors / G.edges[...], which rebuild views per call.
+    succ = G.succ
+    pred = G.pred
+    
     # For each visited node, prune sibling edges
     for visited_id in resolved_visited:
         if visited_id not in G:
             continue
         
         # Find parents of this node
-        parents = list(G.predecessors(visited_id))
-        
-        for parent in parents:
+        for parent in pred[visited_id]:
             # Get all outgoing edges from parent
-            outgoing = list(G.successors(parent))
+            outgoing = succ[parent]
             
             # If visited node is the only child, nothing to prune
             if len(outgoing) <= 1:
@@ -321,22 +363,19 @@ def compute_pruning(
             kept_prob_sum = 0.0
             edges_to_keep = []
             
-            for child in outgoing:
-                edge_data = G.edges[parent, child]
+            for child, edge_data in outgoing.items():
                 p = edge_data.get('p', 0.0) or 0.0
                 
                 if child == visited_id:
                     kept_prob_sum += p
-                    edges_to_keep.append((parent, child))
+                    edges_to_keep.append(((parent, child), p))
                 else:
                     # Exclude this sibling edge
                     excluded_edges.add((parent, child))
             
             # Renormalize kept edges
             if kept_prob_sum > 0:
-                for edge in edges_to_keep:
-                    edge_data = G.edges[edge[0], edge[1]]
-                    old_p = edge_data.get('p', 0.0) or 0.0
+                for edge, old_p in edges_to_keep:
                     if old_p > 0:
                         # Renorm factor: 1.0 / kept_prob_sum
                         renorm_factors[edge] = 1.0 / kept_prob_sum
@@ -345,18 +384,18 @@ def compute_pruning(
     for group in resolved_any_groups:
         group_set = set(group)
         
-        # Find common parents of group members
-        parents_per_node = {n: set(G.predecessors(n)) for n in group if n in G}
-        if not parents_per_node:
-            continue
-        
         # Get all parents that have at least one group member as child
         all_parents = set()
-        for parents in parents_per_node.values():
-            all_parents.update(parents)
-        
+        any_in_graph = False
+        for n in group:
+            if n in G:
+                any_in_graph = True
+                all_parents.update(pred[n])
+        if not any_in_graph:
+            continue
+
         for parent in all_parents:
-            outgoing = list(G.successors(parent))
+            outgoing = succ[parent]
             
             # Find which children are in the group
             in_group = [c for c in outgoing if c in group_set]
@@ -373,8 +412,7 @@ def compute_pruning(
             # Calculate renormalization for kept edges
             kept_prob_sum = 0.0
             for child in in_group:
-                edge_data = G.edges[parent, child]
-                p = edge_data.get('p', 0.0) or 0.0
+                p = outgoing[child].get('p', 0.0) or 0.0
                 kept_prob_sum += p
             
             # Apply renormalization
@@ -390,6 +428,333 @@ def compute_pruning(
     )
 
 
+class _EdgeIndex(dict):
+    """
+    Followed out-edges per node: node key -> [(target, p, cost_gbp, labour_cost), ...].
+
+    Filled on first access, so one instance shared by every fold of an analysis call reads
+    each edge's attributes once: excluded edges are dropped, p is renormalised and missing
+    values become 0.
+    """
+
+    def __init__(self, G: nx.DiGraph, pruning: Optional[PruningResult] = None):
+        super().__init__()
+        self.succ = G.succ
+        # Pruning regrouped by parent: {parent: {child: renorm factor, or None if excluded}},
+        # so edges are looked up by child rather than by a (source, target) tuple.
+        self.pruned: dict[str, dict[str, Optional[float]]] = {}
+        if pruning is not None:
+            for (parent, child), factor in pruning.renorm_factors.items():
+                self.pruned.setdefault(parent, {})[child] = factor
+            for parent, child in pruning.excluded_edges:
+                self.pruned.setdefault(parent, {})[child] = None  # Exclusion wins over renorm
+
+    def __missing__(self, node_id: str) -> list[tuple[str, float, float, float]]:
+        edges = []
+        # Pruning only ever touches the out-edges of a few parents.
+        rules = self.pruned.get(node_id)
+        for target, data in self.succ[node_id].items():
+            p = data.get('p', 0.0) or 0.0
+            if rules is not None and target in rules:
+                factor = rules[target]
+                if factor is None:
+                    continue  # Excluded
+                p *= factor
+            edges.append((target, p, data.get('cost_gbp', 0.0) or 0.0, data.get('labour_cost', 0.0) or 0.0))
+        self[node_id] = edges
+        return edges
+
+
+def _reachable_edge_table(
+    adj: _EdgeIndex,
+    start_keys: list[str],
+    end_keys: list[str],
+) -> Optional[tuple[dict[str, int], list[tuple[int, list[tuple[int, float, float, float]]]]]]:
+    """
+    Followed out-edges of every node reachable from any of start_keys, in DFS post-order
+    (each node after all of its successors).
+
+    Returns (index, table): index maps each reached node key to a dense int (end_keys come
+    first), and table is [(node_index, [(target_index, p, cost_gbp, labour_cost), ...]), ...].
+    end_keys are not expanded and not in the table. Returns None if a cycle is reachable,
+    since there is then no topological order.
+    """
+    table: list[tuple[int, list[tuple[int, float, float, float]]]] = []
+    # A node with an index is an end key, finished, or on the current DFS path.
+    index: dict[str, int] = {}
+    for end_key in end_keys:
+        index.setdefault(end_key, len(index))
+    on_stack: set[str] = set()
+    for root in start_keys:
+        if root in index:
+            continue
+        index[root] = len(index)
+        on_stack.add(root)
+        stack = [(root, index[root], iter(adj[root]), [])]
+        while stack:
+            node_id, node_idx, children, edges = stack[-1]
+            for child, p, edge_gbp, edge_time in children:
+                child_idx = index.get(child)
+                if child_idx is None:
+                    child_idx = index[child] = len(index)
+                    edges.append((child_idx, p, edge_gbp, edge_time))
+                    on_stack.add(child)
+                    stack.append((child, child_idx, iter(adj[child]), []))
+                    break
+                if child in on_stack:
+                    return None  # Cycle
+                edges.append((child_idx, p, edge_gbp, edge_time))
+            else:
+                stack.pop()
+                on_stack.discard(node_id)
+                table.append((node_idx, edges))
+    return index, table
+
+
+def _calculate_path_probability_dfs(
+    adj: _EdgeIndex,
+    start_id: str,
+    end_id: str,
+) -> PathResult:
+    """
+    Memoised-DFS form of calculate_path_probability, used when a cycle is reachable.
+
+    A back edge to a node still being expanded contributes 0, which has no
+    topological-order equivalent. The DFS runs on an explicit stack (no recursion
+    limit); each frame is [node_id, edge iterator, pending edge, *accumulators] and
+    a finished frame folds its totals into the pending edge of its parent.
+    """
+    if start_id == end_id:
+        return PathResult(
+            probability=1.0,
+            expected_cost_gbp=0.0,
+            expected_labour_cost=0.0,
+            expected_cost_gbp_given_success=0.0,
+            expected_labour_cost_given_success=0.0,
+        )
+
+    # Probability to reach end_id and UNCONDITIONAL expected costs (regardless of whether
+    # end_id is reached). Both follow exactly the same edges, so one walk computes both.
+    prob_cache: dict[str, float] = {}
+    cost_cache: dict[str, tuple[float, float]] = {}
+    visiting: set[str] = {start_id}  # For cycle detection
+    stack = [[start_id, iter(adj[start_id]), None, 0.0, 0.0, 0.0]]
+    while stack:
+        frame = stack[-1]
+        for target, p, edge_gbp, edge_time in frame[1]:
+            if target == end_id:
+                target_prob, target_gbp, target_time = 1.0, 0.0, 0.0
+            elif target in prob_cache:
+                target_prob = prob_cache[target]
+                target_gbp, target_time = cost_cache[target]
+            elif target in visiting:
+                target_prob, target_gbp, target_time = 0.0, 0.0, 0.0  # Cycle
+            else:
+                frame[2] = (p, edge_gbp, edge_time)
+                visiting.add(target)
+                stack.append([target, iter(adj[target]), None, 0.0, 0.0, 0.0])
+                break
+            frame[3] += p * target_prob
+            frame[4] += p * (edge_gbp + target_gbp)
+            frame[5] += p * (edge_time + target_time)
+        else:
+            stack.pop()
+            node_id, _, _, total_prob, total_gbp, total_time = frame
+            visiting.discard(node_id)
+            prob_cache[node_id] = total_prob
+            cost_cache[node_id] = (total_gbp, total_time)
+            if stack:
+                parent = stack[-1]
+                p, edge_gbp, edge_time = parent[2]
+                parent[3] += p * total_prob
+                parent[4] += p * (edge_gbp + total_gbp)
+                parent[5] += p * (edge_time + total_time)
+
+    probability = prob_cache[start_id]
+    exp_gbp, exp_time = cost_cache[start_id]
+
+    exp_gbp_given = None
+    exp_labour_given = None
+    if probability > 0:
+        # CONDITIONAL cost numerator:
+        # numerator(node) = E[cost * I(reach end_id) | starting at node]
+        # Then: E[cost | reach end_id] = numerator(start) / P(reach end_id).
+        # Every node this walk can reach was already visited above, so prob_cache is complete.
+        cond_num_cache: dict[str, tuple[float, float]] = {}
+        visiting = {start_id}
+        stack = [[start_id, iter(adj[start_id]), None, 0.0, 0.0]]
+        while stack:
+            frame = stack[-1]
+            for target, p, edge_gbp, edge_labour in frame[1]:
+                if p == 0:
+                    continue
+                target_prob = 1.0 if target == end_id else prob_cache[target]
+                if target_prob == 0:
+                    # If the target can't reach end_id, this branch contributes nothing to the conditional numerator.
+                    continue
+                if target == end_id:
+                    target_num_gbp, target_num_labour = 0.0, 0.0
+                elif target in cond_num_cache:
+                    target_num_gbp, target_num_labour = cond_num_cache[target]
+                elif target in visiting:
+                    target_num_gbp, target_num_labour = 0.0, 0.0  # Cycle
+                else:
+                    frame[2] = (p, edge_gbp, edge_labour, target_prob)
+                    visiting.add(target)
+                    stack.append([target, iter(adj[target]), None, 0.0, 0.0])
+                    break
+                # Edge cost only contributes if we eventually reach end_id from target.
+                frame[3] += p * (target_num_gbp + (target_prob * edge_gbp))
+                frame[4] += p * (target_num_labour + (target_prob * edge_labour))
+            else:
+                stack.pop()
+                node_id, _, _, total_num_gbp, total_num_labour = frame
+                visiting.discard(node_id)
+                cond_num_cache[node_id] = (total_num_gbp, total_num_labour)
+                if stack:
+                    parent = stack[-1]
+                    p, edge_gbp, edge_labour, target_prob = parent[2]
+                    parent[3] += p * (total_num_gbp + (target_prob * edge_gbp))
+                    parent[4] += p * (total_num_labour + (target_prob * edge_labour))
+
+        num_gbp, num_labour = cond_num_cache[start_id]
+        exp_gbp_given = num_gbp / probability
+        exp_labour_given = num_labour / probability
+
+    return PathResult(
+        probability=probability,
+        expected_cost_gbp=exp_gbp,
+        expected_labour_cost=exp_time,
+        expected_cost_gbp_given_success=exp_gbp_given,
+        expected_labour_cost_given_success=exp_labour_given,
+        path_exists=probability > 0
+    )
+
+
+def _fold_to_end(
+    size: int,
+    table: list[tuple[int, list[tuple[int, float, float, float]]]],
+    end_idx: int,
+) -> list[tuple[float, float, float, float, float]]:
+    """
+    Fold probability and costs to the end node at end_idx over a _reachable_edge_table.
+
+    The table is in post-order, so each node reads its targets' finished values:
+
+      prob(node)      = Σ p · prob(target)                     (P(reach end))
+      cost(node)      = Σ p · (edge_cost + cost(target))       (UNCONDITIONAL expected cost)
+      numerator(node) = Σ p · (numerator(target) + prob(target) · edge_cost)
+
+    numerator(node) = E[cost · I(reach end) | starting at node], so
+    E[cost | reach end] = numerator(start) / P(reach end). Branches with p == 0 or
+    prob(target) == 0 contribute nothing to the numerator.
+
+    Returns values[node_index] = (prob, cost_gbp, cost_labour, numerator_gbp, numerator_labour).
+    Unexpanded nodes other than the end (other end keys) stay all-zero.
+    """
+    values: list[tuple[float, float, float, float, float]] = [(0.0, 0.0, 0.0, 0.0, 0.0)] * size
+    values[end_idx] = (1.0, 0.0, 0.0, 0.0, 0.0)
+
+    for node_idx, edges in table:
+        total_prob = 0.0
+        total_gbp = 0.0
+        total_time = 0.0
+        total_num_gbp = 0.0
+        total_num_labour = 0.0
+
+        for target, p, edge_gbp, edge_time in edges:
+            target_prob, target_gbp, target_time, target_num_gbp, target_num_labour = values[target]
+
+            total_prob += p * target_prob
+            total_gbp += p * (edge_gbp + target_gbp)
+            total_time += p * (edge_time + target_time)
+
+            if p != 0 and target_prob != 0:
+                total_num_gbp += p * (target_num_gbp + (target_prob * edge_gbp))
+                total_num_labour += p * (target_num_labour + (target_prob * edge_time))
+
+        values[node_idx] = (total_prob, total_gbp, total_time, total_num_gbp, total_num_labour)
+    return values
+
+
+def _folded_path_result(value: tuple[float, float, float, float, float]) -> PathResult:
+    """PathResult for one _fold_to_end slot."""
+    probability, exp_gbp, exp_time, num_gbp, num_labour = value
+
+    exp_gbp_given = None
+    exp_labour_given = None
+    if probability > 0:
+        exp_gbp_given = num_gbp / probability
+        exp_labour_given = num_labour / probability
+
+    return PathResult(
+        probability=probability,
+        expected_cost_gbp=exp_gbp,
+        expected_labour_cost=exp_time,
+        expected_cost_gbp_given_success=exp_gbp_given,
+        expected_labour_cost_given_success=exp_labour_given,
+        path_exists=probability > 0
+    )
+
+
+def _path_results_to(
+    adj: _EdgeIndex,
+    start_keys: list[str],
+    end_key: str,
+) -> dict[str, PathResult]:
+    """
+    calculate_path_probability from each of start_keys (graph keys) to end_key.
+
+    A node's probability and costs to end_key depend only on its own out-edges, so a single
+    fold over the nodes reachable from any start serves every start.
+    """
+    reached = _reachable_edge_table(adj, start_keys, [end_key])
+    if reached is None:
+        if len(start_keys) > 1:
+            # Only starts that actually reach the cycle need the DFS.
+            return {s: _path_results_to(adj, [s], end_key)[s] for s in start_keys}
+        return {s: _calculate_path_probability_dfs(adj, s, end_key) for s in start_keys}
+
+    index, table = reached
+    values = _fold_to_end(len(index), table, index[end_key])
+    return {s: _folded_path_result(values[index[s]]) for s in start_keys}
+
+
+def _path_results_from(
+    adj: _EdgeIndex,
+    start_key: str,
+    end_keys: list[str],
+) -> dict[str, PathResult]:
+    """
+    calculate_path_probability from start_key (a graph key) to each of end_keys.
+
+    Ends with no followed out-edges (absorbing nodes, normally) are the same whether or not
+    they are expanded, so one reachable table with all of them left unexpanded serves every
+    such end; each then needs only its own fold.
+    """
+    leaves = [e for e in end_keys if not adj[e]]
+    reached = _reachable_edge_table(adj, [start_key], leaves) if len(leaves) > 1 else None
+    if reached is None:
+        return {e: _path_results_to(adj, [start_key], e)[start_key] for e in end_keys}
+
+    index, table = reached
+    results: dict[str, PathResult] = {}
+    for end_key in end_keys:
+        if adj[end_key]:
+            results[end_key] = _path_results_to(adj, [start_key], end_key)[start_key]
+        else:
+            values = _fold_to_end(len(index), table, index[end_key])
+            results[end_key] = _folded_path_result(values[index[start_key]])
+    return results
+
+
+def _entry_weights(G: nx.DiGraph, entry_nodes: list[str]) -> dict[str, float]:
+    """Weight of each entry node: its entry_weight if specified, else an equal share."""
+    default_weight = 1.0 / len(entry_nodes)
+    nodes = G.nodes
+    return {entry: nodes[entry].get('entry_weight', default_weight) for entry in entry_nodes}
+
+
 def calculate_path_probability(
     G: nx.DiGraph,
     start_id: str,
@@ -399,7 +764,8 @@ def calculate_path_probability(
     """
     Calculate probability and expected costs from start to end.
     
-    Uses DFS with memoization to handle multiple paths.
+    Sums over all paths with a single pass over the nodes reachable from start,
+    in reverse topological order (memoised DFS if a cycle is reachable).
     
     Args:
         G: NetworkX DiGraph with edge 'p', 'cost_gbp', 'labour_cost' attrs
@@ -410,8 +776,6 @@ def calculate_path_probability(
     Returns:
         PathResult with probability and expected costs
     """
-    from .graph_builder import resolve_node_id
-    
     # Resolve human-readable IDs to graph keys (UUIDs)
     resolved_start = resolve_node_id(G, start_id) if start_id else None
     resolved_end = resolve_node_id(G, end_id) if end_id else None
@@ -427,8 +791,7 @@ def calculate_path_probability(
     start_id = resolved_start
     end_id = resolved_end
     
-    excluded = pruning.excluded_edges if pruning else set()
-    renorm = pruning.renorm_factors if pruning else {}
+    adj = _EdgeIndex(G, pruning)
     
     # IMPORTANT (Layer-1 decision): Do NOT apply edge.conditional_p implicitly in runner analytics.
     #
@@ -439,163 +802,7 @@ def calculate_path_probability(
     # NOTE: This means we intentionally do NOT switch to the state-space algorithm based
     # on the mere presence of conditional_p on any edge.
 
-    # Otherwise, use fast DFS with memoization.
-    # DFS with memoization for probability to reach end_id
-    prob_cache: dict[str, float] = {}
-    visiting: set[str] = set()  # For cycle detection
-    
-    def calc_prob(node_id: str) -> float:
-        if node_id == end_id:
-            return 1.0
-        
-        if node_id in prob_cache:
-            return prob_cache[node_id]
-        
-        if node_id in visiting:
-            return 0.0  # Cycle detected
-        
-        visiting.add(node_id)
-        
-        total_prob = 0.0
-        for _, target, data in G.out_edges(node_id, data=True):
-            edge = (node_id, target)
-            
-            # Skip excluded edges
-            if edge in excluded:
-                continue
-            
-            # Get edge probability
-            p = data.get('p', 0.0) or 0.0
-            
-            # Apply renormalization
-            if edge in renorm:
-                p *= renorm[edge]
-            
-            # Recursive probability to end
-            target_prob = calc_prob(target)
-            total_prob += p * target_prob
-        
-        visiting.discard(node_id)
-        prob_cache[node_id] = total_prob
-        return total_prob
-    
-    # DFS with memoization for expected costs (UNCONDITIONAL / from the start):
-    # i.e. expected cost incurred while traversing the process, regardless of whether end_id is reached.
-    cost_cache: dict[str, tuple[float, float]] = {}
-    cost_visiting: set[str] = set()
-    
-    def calc_cost(node_id: str) -> tuple[float, float]:
-        """Returns (expected_gbp, expected_time)"""
-        if node_id == end_id:
-            return (0.0, 0.0)
-        
-        if node_id in cost_cache:
-            return cost_cache[node_id]
-        
-        if node_id in cost_visiting:
-            return (0.0, 0.0)  # Cycle
-        
-        cost_visiting.add(node_id)
-        
-        total_gbp = 0.0
-        total_time = 0.0
-        
-        for _, target, data in G.out_edges(node_id, data=True):
-            edge = (node_id, target)
-            
-            if edge in excluded:
-                continue
-            
-            p = data.get('p', 0.0) or 0.0
-            if edge in renorm:
-                p *= renorm[edge]
-            
-            # Edge costs
-            edge_gbp = data.get('cost_gbp', 0.0) or 0.0
-            edge_time = data.get('labour_cost', 0.0) or 0.0
-            
-            # Recursive costs
-            target_gbp, target_time = calc_cost(target)
-            
-            # Probability-weighted costs
-            total_gbp += p * (edge_gbp + target_gbp)
-            total_time += p * (edge_time + target_time)
-        
-        cost_visiting.discard(node_id)
-        cost_cache[node_id] = (total_gbp, total_time)
-        return (total_gbp, total_time)
-
-    # DFS for CONDITIONAL cost numerator:
-    # numerator(node) = E[cost * I(reach end_id) | starting at node]
-    # Then: E[cost | reach end_id] = numerator(start) / P(reach end_id).
-    cond_num_cache: dict[str, tuple[float, float]] = {}
-    cond_visiting: set[str] = set()
-
-    def calc_conditional_numerator(node_id: str) -> tuple[float, float]:
-        """Returns (gbp_numerator, labour_numerator)."""
-        if node_id == end_id:
-            return (0.0, 0.0)
-
-        if node_id in cond_num_cache:
-            return cond_num_cache[node_id]
-
-        if node_id in cond_visiting:
-            return (0.0, 0.0)  # Cycle
-
-        cond_visiting.add(node_id)
-
-        total_num_gbp = 0.0
-        total_num_labour = 0.0
-
-        for _, target, data in G.out_edges(node_id, data=True):
-            edge = (node_id, target)
-
-            if edge in excluded:
-                continue
-
-            p = data.get('p', 0.0) or 0.0
-            if edge in renorm:
-                p *= renorm[edge]
-
-            if p == 0:
-                continue
-
-            edge_gbp = data.get('cost_gbp', 0.0) or 0.0
-            edge_labour = data.get('labour_cost', 0.0) or 0.0
-
-            target_prob = calc_prob(target)
-            if target_prob == 0:
-                # If the target can't reach end_id, this branch contributes nothing to the conditional numerator.
-                continue
-
-            target_num_gbp, target_num_labour = calc_conditional_numerator(target)
-
-            # Edge cost only contributes if we eventually reach end_id from target.
-            total_num_gbp += p * (target_num_gbp + (target_prob * edge_gbp))
-            total_num_labour += p * (target_num_labour + (target_prob * edge_labour))
-
-        cond_visiting.discard(node_id)
-        cond_num_cache[node_id] = (total_num_gbp, total_num_labour)
-        return (total_num_gbp, total_num_labour)
-    
-    probability = calc_prob(start_id)
-    exp_gbp, exp_time = calc_cost(start_id)
-
-    exp_gbp_given = None
-    exp_labour_given = None
-    if probability > 0:
-        num_gbp, num_labour = calc_conditional_numerator(start_id)
-        exp_gbp_given = num_gbp / probability
-        exp_labour_given = num_labour / probability
-    
-    return PathResult(
-        probability=probability,
-        expected_cost_gbp=exp_gbp,
-        expected_labour_cost=exp_time,
-        expected_cost_gbp_given_success=exp_gbp_given,
-        expected_labour_cost_given_success=exp_labour_given,
-        path_exists=probability > 0
-    )
+    return _path_results_to(adj, [start_id], end_id)[start_id]
 
 
 def calculate_path_through_node(
@@ -616,8 +823,6 @@ def calculate_path_through_node(
     Returns:
         PathResult with combined probability and costs
     """
-    from .graph_builder import find_entry_nodes, find_absorbing_nodes, resolve_node_id
-    
     # Resolve human-readable ID to graph key
     resolved_id = resolve_node_id(G, node_id)
     if not resolved_id:
@@ -646,10 +851,11 @@ def calculate_path_through_node(
     cost_to_node_gbp = 0.0
     cost_to_node_time = 0.0
     
-    for entry in entry_nodes:
-        result = calculate_path_probability(G, entry, node_id, pruning)
-        # Weight by entry weight if specified, else equal weight
-        entry_weight = G.nodes[entry].get('entry_weight', 1.0 / len(entry_nodes))
+    adj = _EdgeIndex(G, pruning)
+    # One fold towards node_id gives every entry's result at once.
+    to_node = _path_results_to(adj, entry_nodes, node_id)
+    for entry, entry_weight in _entry_weights(G, entry_nodes).items():
+        result = to_node[entry]
         prob_to_node += entry_weight * result.probability
         cost_to_node_gbp += entry_weight * result.expected_cost_gbp
         cost_to_node_time += entry_weight * result.expected_labour_cost
@@ -659,8 +865,9 @@ def calculate_path_through_node(
     cost_from_node_gbp = 0.0
     cost_from_node_time = 0.0
     
+    from_node = _path_results_from(adj, node_id, absorbing_nodes)
     for absorbing in absorbing_nodes:
-        result = calculate_path_probability(G, node_id, absorbing, pruning)
+        result = from_node[absorbing]
         prob_from_node += result.probability
         cost_from_node_gbp += result.probability * result.expected_cost_gbp
         cost_from_node_time += result.probability * result.expected_labour_cost
@@ -693,8 +900,6 @@ def calculate_path_to_absorbing(
     Returns:
         PathResult with probability from entries to this absorbing node
     """
-    from .graph_builder import find_entry_nodes, resolve_node_id
-    
     # Resolve human-readable ID to graph key
     resolved_id = resolve_node_id(G, absorbing_id)
     if not resolved_id:
@@ -723,9 +928,11 @@ def calculate_path_to_absorbing(
     total_num_gbp = 0.0
     total_num_labour = 0.0
     
-    for entry in entry_nodes:
-        result = calculate_path_probability(G, entry, absorbing_id, pruning)
-        entry_weight = G.nodes[entry].get('entry_weight', 1.0 / len(entry_nodes))
+    adj = _EdgeIndex(G, pruning)
+    # One fold towards absorbing_id gives every entry's result at once.
+    to_absorbing = _path_results_to(adj, entry_nodes, absorbing_id)
+    for entry, entry_weight in _entry_weights(G, entry_nodes).items():
+        result = to_absorbing[entry]
         
         total_prob += entry_weight * result.probability
         total_gbp += entry_weight * result.expected_cost_gbp
@@ -827,7 +1034,6 @@ def run_path_analysis(
     
     else:
         # No from/to specified - general graph stats
-        from .graph_builder import get_graph_stats
         stats = get_graph_stats(G)
         return {
             'analysis_type': 'general',
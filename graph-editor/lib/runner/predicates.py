@@ -6,6 +6,7 @@ Compute predicates from graph + selection to determine analysis type.
 Design Reference: /docs/current/project-analysis/DSL_CONSTRUCTION_CASES.md
 """
 
+from collections import deque
 from typing import Optional
 import networkx as nx
 
@@ -64,41 +65,39 @@ def compute_selection_predicates(
         })
         return predicates
     
-    # Check node types
+    # Check node types, and find starts (no selected predecessors) and ends (no selected
+    # successors), reading each node's data and adjacency once
+    nodes = G.nodes
+    pred = G.pred
+    succ = G.succ
     absorbing_flags = []
     entry_flags = []
-    for nid in selected_node_ids:
-        if nid in G.nodes:
-            node_data = G.nodes[nid]
-            is_absorbing = node_data.get('absorbing', False) or G.out_degree(nid) == 0
-            is_entry = node_data.get('is_entry', False) or G.in_degree(nid) == 0
-            absorbing_flags.append(is_absorbing)
-            entry_flags.append(is_entry)
-        else:
-            absorbing_flags.append(False)
-            entry_flags.append(False)
-    
-    predicates['all_absorbing'] = all(absorbing_flags) if absorbing_flags else False
-    predicates['all_entry'] = all(entry_flags) if entry_flags else False
-    
-    # Find starts (no selected predecessors) and ends (no selected successors)
     starts = []
     ends = []
     
     for nid in selected_node_ids:
-        if nid not in G.nodes:
+        if nid not in nodes:
+            absorbing_flags.append(False)
+            entry_flags.append(False)
             continue
-            
+        
+        node_data = nodes[nid]
+        predecessors = pred[nid]
+        successors = succ[nid]
+        absorbing_flags.append(node_data.get('absorbing', False) or len(successors) == 0)
+        entry_flags.append(node_data.get('is_entry', False) or len(predecessors) == 0)
+        
         # Check if any predecessor is in selection
-        has_selected_pred = any(pred in selected_set for pred in G.predecessors(nid))
-        if not has_selected_pred:
+        if selected_set.isdisjoint(predecessors):
             starts.append(nid)
         
         # Check if any successor is in selection
-        has_selected_succ = any(succ in selected_set for succ in G.successors(nid))
-        if not has_selected_succ:
+        if selected_set.isdisjoint(successors):
             ends.append(nid)
     
+    predicates['all_absorbing'] = all(absorbing_flags) if absorbing_flags else False
+    predicates['all_entry'] = all(entry_flags) if entry_flags else False
+    
     predicates['has_unique_start'] = len(starts) == 1
     predicates['start_node'] = starts[0] if len(starts) == 1 else None
     predicates['has_unique_end'] = len(ends) == 1
@@ -108,10 +107,10 @@ def compute_selection_predicates(
     
     # Topological sorting and sequentiality
     if predicates['has_unique_start'] and predicates['has_unique_end']:
-        try:
-            # Try to topo sort just the selected nodes
-            subgraph = G.subgraph(selected_node_ids)
-            sorted_ids = list(nx.topological_sort(subgraph))
+        # Topo sort just the selected nodes
+        topo = _topo_sort_selection(G, starts[0], selected_set)
+        if topo is not None:
+            sorted_ids, is_seq = topo
             predicates['sorted_nodes'] = sorted_ids
             
             # Intermediate nodes are those between start and end
@@ -120,16 +119,10 @@ def compute_selection_predicates(
             else:
                 predicates['intermediate_nodes'] = []
             
-            # Check if sequential (direct edges between consecutive)
-            is_seq = True
-            for i in range(len(sorted_ids) - 1):
-                if not G.has_edge(sorted_ids[i], sorted_ids[i + 1]):
-                    is_seq = False
-                    break
             predicates['is_sequential'] = is_seq
             
-        except nx.NetworkXError:
-            # Graph has cycle or other issue
+        else:
+            # Selection has a cycle
             predicates['is_sequential'] = False
             predicates['sorted_nodes'] = selected_node_ids
             predicates['intermediate_nodes'] = []
@@ -144,18 +137,52 @@ def compute_selection_predicates(
     
     # Node type flags for single node
     if n == 1:
-        nid = selected_node_ids[0]
-        if nid in G.nodes:
-            node_data = G.nodes[nid]
-            predicates['is_graph_entry'] = node_data.get('is_entry', False) or G.in_degree(nid) == 0
-            predicates['is_graph_absorbing'] = node_data.get('absorbing', False) or G.out_degree(nid) == 0
-        else:
-            predicates['is_graph_entry'] = False
-            predicates['is_graph_absorbing'] = False
+        # Same tests as the node type flags above (False if the node is not in the graph)
+        predicates['is_graph_entry'] = entry_flags[0]
+        predicates['is_graph_absorbing'] = absorbing_flags[0]
     
     return predicates
 
 
+def _topo_sort_selection(
+    G: nx.DiGraph,
+    start: str,
+    selected_set: set[str],
+) -> Optional[tuple[list[str], bool]]:
+    """
+    Topologically sort the selected nodes with Kahn's algorithm from the unique start.
+
+    Only edges between selected nodes count, and children are queued in adjacency order: the
+    same order nx.topological_sort gives on the selection's subgraph when it has one source.
+    Returns (sorted_ids, is_sequential), where is_sequential means every node has a direct
+    edge to the next, or None if the selection contains a cycle.
+    """
+    pred = G.pred
+    succ = G.succ
+    # Selected predecessors not yet emitted, per selected node in the graph
+    pending = {nid: len(selected_set.intersection(pred[nid])) for nid in selected_set if nid in pred}
+    
+    sorted_ids = []
+    is_sequential = True
+    queue = deque([start])
+    while queue:
+        nid = queue.popleft()
+        sorted_ids.append(nid)
+        children = succ[nid]
+        for child in children:
+            if child in pending:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    queue.append(child)
+        # The head of the queue is the next node in the order
+        if queue and queue[0] not in children:
+            is_sequential = False
+    
+    if len(sorted_ids) != len(pending):
+        return None
+    return sorted_ids, is_sequential
+
+
 def _check_all_siblings(G: nx.DiGraph, node_ids: list[str]) -> bool:
     """
     Check if all nodes share at least one common parent.
@@ -165,72 +192,62 @@ def _check_all_siblings(G: nx.DiGraph, node_ids: list[str]) -> bool:
     if len(node_ids) < 2:
         return False
     
-    # Get parent sets for each node
-    parent_sets = []
+    # Intersect parent sets node by node, stopping as soon as no common parent is left
+    pred = G.pred
+    common_parents = None
     for nid in node_ids:
-        if nid in G.nodes:
-            parents = set(G.predecessors(nid))
-            parent_sets.append(parents)
+        if nid not in pred:
+            return False
+        if common_parents is None:
+            common_parents = set(pred[nid])
         else:
-            parent_sets.append(set())
-    
-    if not parent_sets:
-        return False
+            common_parents.intersection_update(pred[nid])
+        if not common_parents:
+            return False
     
-    # Check if there's a common parent across all
-    common_parents = parent_sets[0]
-    for ps in parent_sets[1:]:
-        common_parents = common_parents.intersection(ps)
-    
-    return len(common_parents) > 0
+    return True
 
 
 def _find_sibling_groups(G: nx.DiGraph, node_ids: list[str]) -> list[list[str]]:
     """
     Group nodes by shared parent.
     
-    Returns list of sibling groups (nodes sharing a parent).
+    Returns list of sibling groups: nodes linked through shared parents, transitively
+    (x and z are grouped if each shares a parent with y), in selection order.
     """
     if len(node_ids) < 2:
         return [[nid] for nid in node_ids]
     
-    # Map each node to its parents
-    node_to_parents = {}
-    for nid in node_ids:
-        if nid in G.nodes:
-            node_to_parents[nid] = frozenset(G.predecessors(nid))
-        else:
-            node_to_parents[nid] = frozenset()
+    unique_ids = list(dict.fromkeys(node_ids))
     
-    # Group nodes that share parents
-    groups = []
-    processed = set()
+    # Union-find over the selection, with each parent unioning its selected children
+    # into the group of the first one seen
+    root = {nid: nid for nid in unique_ids}
     
-    for nid in node_ids:
-        if nid in processed:
-            continue
-            
-        parents = node_to_parents[nid]
-        if not parents:
-            groups.append([nid])
-            processed.add(nid)
+    def find(nid: str) -> str:
+        while root[nid] != nid:
+            root[nid] = root[root[nid]]
+            nid = root[nid]
+        return nid
+    
+    pred = G.pred
+    first_child: dict[str, str] = {}
+    for nid in unique_ids:
+        if nid not in pred:
             continue
-        
-        # Find all nodes that share at least one parent with this node
-        group = [nid]
-        processed.add(nid)
-        
-        for other_nid in node_ids:
-            if other_nid in processed:
-                continue
-            other_parents = node_to_parents[other_nid]
-            if parents.intersection(other_parents):
-                group.append(other_nid)
-                processed.add(other_nid)
-        
-        groups.append(group)
+        for parent in pred[nid]:
+            other = first_child.setdefault(parent, nid)
+            if other != nid:
+                other_root = find(other)
+                nid_root = find(nid)
+                if other_root != nid_root:
+                    root[nid_root] = other_root
+    
+    groups: dict[str, list[str]] = {}
+    for nid in unique_ids:
+        groups.setdefault(find(nid), []).append(nid)
     
-    return groups
+    return list(groups.values())
 
 
 def get_node_type(G: nx.DiGraph, node_id: str) -> str:
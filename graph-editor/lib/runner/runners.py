@@ -2058,28 +2058,18 @@ def run_graph_overview(
             'probability_label': s['probability_label'],
         }
 
-        entry_nodes = find_entry_nodes(scenario_G)
-
         for absorbing in absorbing_nodes:
-            total_prob = 0.0
-            total_cost_gbp = 0.0
-            total_labour_cost = 0.0
-
-            for entry in entry_nodes:
-                entry_weight = scenario_G.nodes[entry].get('entry_weight', 1.0 / len(entry_nodes)) if entry_nodes else 0
-                result = calculate_path_probability(scenario_G, entry, absorbing, pruning)
-                total_prob += entry_weight * result.probability
-                total_cost_gbp += entry_weight * result.expected_cost_gbp
-                total_labour_cost += entry_weight * result.expected_labour_cost
+            # Entry-weighted totals over all entry nodes, from a single fold per outcome.
+            result = calculate_path_to_absorbing(scenario_G, absorbing, pruning)
 
             data_rows.append({
                 'outcome': absorbing,
                 'scenario_id': scenario_id,
                 'scenario_name': scenario_name,
                 'visibility_mode': visibility_mode,
-                'probability': total_prob,
-                'expected_cost_gbp': total_cost_gbp,
-                'expected_labour_cost': total_labour_cost,
+                'probability': result.probability,
+                'expected_cost_gbp': result.expected_cost_gbp,
+                'expected_labour_cost': result.expected_labour_cost,
             })
     
     # Get graph stats from primary graph
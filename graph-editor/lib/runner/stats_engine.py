@@ -50,16 +50,22 @@ LATENCY_MIN_EFFECTIVE_SAMPLE_SIZE = 150
 LATENCY_EPSILON = 1e-9
 
 
+_T95_Z = standard_normal_inverse_cdf(T95_PERCENTILE)
+
+
 # ─────────────────────────────────────────────────────────────
 # Recency weighting
 # ─────────────────────────────────────────────────────────────
 
+_LN2 = math.log(2)
+
+
 def _recency_weight(age_days: float, half_life_days: float) -> float:
     if half_life_days <= 0 or not math.isfinite(half_life_days):
         return 1.0
     if not math.isfinite(age_days) or age_days < 0:
         return 1.0
-    return math.exp(-math.log(2) * age_days / half_life_days)
+    return math.exp(-_LN2 * age_days / half_life_days)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -226,7 +232,7 @@ def improve_fit_with_t95(
     """One-way sigma widening: if authoritative t95 implies a larger sigma, use it."""
     sigma_safe = fit.sigma if (math.isfinite(fit.sigma) and fit.sigma > 0) else LATENCY_DEFAULT_SIGMA
 
-    z = standard_normal_inverse_cdf(T95_PERCENTILE)
+    z = _T95_Z
     can_compute = (
         math.isfinite(z) and z > 0
         and math.isfinite(median_lag_days) and median_lag_days > 0
@@ -280,7 +286,7 @@ def get_completeness_cdf_params(
 
     auth_t95_model = to_model_space_lag_days(onset_delta_days, authoritative_t95_days) if onset_delta_days > 0 else authoritative_t95_days
 
-    z = standard_normal_inverse_cdf(T95_PERCENTILE)
+    z = _T95_Z
     can_compute = (
         math.isfinite(z) and z > 0
         and math.isfinite(median_lag_days) and median_lag_days > 0
@@ -552,7 +558,7 @@ def compute_edge_latency_stats(
     )
 
     # Step 2: Derive t95
-    t95_from_fit_x = log_normal_inverse_cdf(T95_PERCENTILE, fit_initial.mu, fit_initial.sigma) if fit_initial.empirical_quality_ok else to_model_space_lag_days(onset_delta_days, default_t95_days)
+    t95_from_fit_x = math.exp(fit_initial.mu + fit_initial.sigma * _T95_Z) if fit_initial.empirical_quality_ok else to_model_space_lag_days(onset_delta_days, default_t95_days)
     t95_from_fit_t = onset_delta_days + t95_from_fit_x
 
     # Step 3: Authoritative t95
@@ -569,7 +575,7 @@ def compute_edge_latency_stats(
 
     # Step 5: Final t95
     if fit.empirical_quality_ok:
-        t95_x = log_normal_inverse_cdf(T95_PERCENTILE, fit.mu, fit.sigma)
+        t95_x = math.exp(fit.mu + fit.sigma * _T95_Z)
         t95 = onset_delta_days + t95_x
     else:
         t95 = auth_t95
@@ -579,7 +585,7 @@ def compute_edge_latency_stats(
     sigma_constrained = fit.sigma if (math.isfinite(fit.sigma) and fit.sigma > 0) else sigma_moments_safe
     tail_applied = sigma_constrained > sigma_moments_safe + 1e-12
 
-    z_val = standard_normal_inverse_cdf(T95_PERCENTILE)
+    z_val = _T95_Z
     sigma_min_from_t95 = None
     if (math.isfinite(z_val) and z_val > 0
             and math.isfinite(model_median) and model_median > 0
@@ -986,18 +992,19 @@ def enhance_graph_latencies(
             edge_path_t95_val = path_t95_to_node + latency_stats.t95
             from_node_id = edge["from"]
             if anchor_cohorts:
-                total_wn = sum(
+                anchor_wn = [
                     c.n * _recency_weight(c.age, s.recency_half_life_days)
                     for c in anchor_cohorts
-                )
+                ]
+                total_wn = sum(anchor_wn)
                 if total_wn > 0:
                     a_median = sum(
-                        c.n * _recency_weight(c.age, s.recency_half_life_days) * c.anchor_median_lag_days
-                        for c in anchor_cohorts
+                        wn * c.anchor_median_lag_days
+                        for wn, c in zip(anchor_wn, anchor_cohorts)
                     ) / total_wn
                     a_mean = sum(
-                        c.n * _recency_weight(c.age, s.recency_half_life_days) * (c.anchor_mean_lag_days if c.anchor_mean_lag_days else c.anchor_median_lag_days)
-                        for c in anchor_cohorts
+                        wn * (c.anchor_mean_lag_days if c.anchor_mean_lag_days else c.anchor_median_lag_days)
+                        for wn, c in zip(anchor_wn, anchor_cohorts)
                     ) / total_wn
 
                     anchor_fit_initial = fit_lag_distribution(a_median, a_mean, total_wn)
@@ -1450,7 +1457,8 @@ def _aggregate_lag_stats(
     for c in cohorts:
         if c.k <= 0:
             continue
-        w = _recency_weight(c.age, recency_half_life_days) * c.k
+        rw = _recency_weight(c.age, recency_half_life_days)
+        w = rw * c.k
         if c.median_lag_days is not None and c.median_lag_days > 0:
             w_median_num += c.median_lag_days * w
             w_median_den += w
@@ -1461,7 +1469,7 @@ def _aggregate_lag_stats(
         if effective_mean is not None:
             w_mean_num += effective_mean * w
             w_mean_den += w
-        total_k_w += c.k * _recency_weight(c.age, recency_half_life_days)
+        total_k_w += c.k * rw
 
     median = (w_median_num / w_median_den) if w_median_den > 0 else None
     mean = (w_mean_num / w_mean_den) if w_mean_den > 0 else None
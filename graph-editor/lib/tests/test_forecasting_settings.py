@@ -169,6 +169,14 @@ class TestSettingsFromDict:
         s = settings_from_dict({'forecast_blend_lambda': float('inf')})
         assert s.forecast_blend_lambda == 0.15
 
+    def test_negative_inf_values_ignored(self):
+        s = settings_from_dict({'forecast_blend_lambda': float('-inf')})
+        assert s.forecast_blend_lambda == 0.15
+
+    def test_non_numeric_values_ignored(self):
+        s = settings_from_dict({'forecast_blend_lambda': '0.3'})
+        assert s.forecast_blend_lambda == 0.15
+
 
 class TestSettingsSignature:
 
@@ -27,9 +27,11 @@ from runner.lag_distribution_utils import (
     standard_normal_cdf,
     standard_normal_inverse_cdf,
     log_normal_cdf,
+    log_normal_cdf_array,
     log_normal_survival,
     log_normal_inverse_cdf,
     fit_lag_distribution,
+    fit_lag_distribution_batch,
     to_model_space,
     to_model_space_lag_days,
     to_model_space_age_days,
@@ -119,6 +121,18 @@ class TestStandardNormalInverseCDF:
                 f"p={case['p']}: expected {expected}, got {result}, delta={abs(result - expected)}"
 
 
+    @pytest.mark.parametrize("p,expected", [
+        (0.95, 1.6448536269514722),
+        (0.975, 1.959963984540054),
+        (0.25, -0.6744897501960817),
+        (1e-10, -6.361340902404056),
+        (1e-300, -37.0470962993612),
+    ])
+    def test_double_precision(self, p, expected):
+        # AS241 is accurate to ~1e-16 relative across both tail branches.
+        assert abs(standard_normal_inverse_cdf(p) - expected) <= 1e-14 * max(1.0, abs(expected))
+
+
 # ─────────────────────────────────────────────────────────────
 # log_normal_cdf (golden fixture)
 # ─────────────────────────────────────────────────────────────
@@ -140,6 +154,17 @@ class TestLogNormalCDF:
             assert abs(cdf + surv - 1.0) < 1e-12, f"CDF + survival != 1 at t={t}"
 
 
+class TestLogNormalCDFArray:
+    T_GRID = [-1.0, 0.0, 1e-9, 0.5, 1.0, 3.0, 7.5, 30.0, 1e6, float('inf'), float('nan')]
+
+    def test_matches_scalar(self):
+        mu = math.log(3)
+        for sigma in [0.0, 0.8, 2.5]:
+            arr = log_normal_cdf_array(self.T_GRID, mu, sigma)
+            for t, value in zip(self.T_GRID, arr):
+                assert abs(value - log_normal_cdf(t, mu, sigma)) < 1e-12, f"t={t}, sigma={sigma}"
+
+
 # ─────────────────────────────────────────────────────────────
 # log_normal_inverse_cdf (golden fixture)
 # ─────────────────────────────────────────────────────────────
@@ -199,6 +224,50 @@ class TestFitLagDistribution:
         assert not fit.empirical_quality_ok
 
 
+class TestFitLagDistributionBatch:
+    """Batch fit must agree element-for-element with the scalar fit."""
+
+    CASES = [
+        (c['median_lag'], c['mean_lag'], c['total_k']) for c in GOLDEN['fit_lag_distribution']
+    ] + [
+        (float('nan'), 4.0, 200),
+        (float('inf'), 4.0, 200),
+        (0.0, 4.0, 200),
+        (-1.0, 4.0, 10),
+        (3.0, 3.0, 200),
+        (3.0, 2.8, 200),
+        (3.0, 1.0, 200),
+        (3.0, float('inf'), 200),
+        (3.0, float('nan'), 200),
+        (3.0, -2.0, 200),
+        (3.0, 6.0, 5),
+    ]
+
+    def test_matches_scalar(self):
+        batch = fit_lag_distribution_batch(
+            [c[0] for c in self.CASES],
+            [c[1] for c in self.CASES],
+            [c[2] for c in self.CASES],
+        )
+        assert len(batch) == len(self.CASES)
+        for i, (median, mean, k) in enumerate(self.CASES):
+            scalar = fit_lag_distribution(median, mean, k)
+            fit = batch.fit(i)
+            assert abs(fit.mu - scalar.mu) < 1e-12, f"case {i}: mu {fit.mu} != {scalar.mu}"
+            assert abs(fit.sigma - scalar.sigma) < 1e-12, f"case {i}: sigma {fit.sigma} != {scalar.sigma}"
+            assert fit.empirical_quality_ok == scalar.empirical_quality_ok, f"case {i}"
+            assert (fit.quality_failure_reason is None) == (scalar.quality_failure_reason is None), f"case {i}"
+
+    def test_settings_forwarded(self):
+        batch = fit_lag_distribution_batch([2.0], [4.0], [50], min_fit_converters=100, default_sigma=0.7)
+        assert batch.sigma[0] == 0.7
+        assert not batch.empirical_quality_ok[0]
+        assert batch.quality_failure_reason(0).startswith("Insufficient converters")
+
+    def test_empty(self):
+        assert len(fit_lag_distribution_batch([], [], [])) == 0
+
+
 # ─────────────────────────────────────────────────────────────
 # to_model_space (golden fixture)
 # ─────────────────────────────────────────────────────────────
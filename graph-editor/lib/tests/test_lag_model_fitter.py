@@ -21,9 +21,10 @@ from runner.lag_model_fitter import (
     select_latest_evidence,
     aggregate_evidence,
     fit_model_from_evidence,
+    _mixture_log_normal_quantile,
 )
 from runner.forecasting_settings import ForecastingSettings
-from runner.lag_distribution_utils import LATENCY_DEFAULT_SIGMA
+from runner.lag_distribution_utils import LATENCY_DEFAULT_SIGMA, fit_lag_distribution, log_normal_cdf, log_normal_inverse_cdf
 
 
 # ─────────────────────────────────────────────────────────────
@@ -46,6 +47,36 @@ def _row(anchor_day: str, x: int, y: int,
     }
 
 
+def _fe_bisection_quantile(percentile: float, components: list) -> float:
+    """Reference: mixtureLogNormalQuantile from lagMixtureAggregationService.ts, step for step."""
+    fitted = [
+        (c["weight"], fit_lag_distribution(c["median_days"], c["mean_days"], max(1, math.floor(c["weight"]))))
+        for c in components
+    ]
+    total_w = sum(w for w, _ in fitted)
+    medians = [c["median_days"] for c in components]
+    lo = max(min(medians) / 100, 1e-6)
+    hi = max(max(medians) * 100, lo * 2)
+
+    def mixture_cdf(t):
+        s = 0.0
+        for w, fit in fitted:
+            s += w * log_normal_cdf(t, fit.mu, fit.sigma)
+        return s / total_w
+
+    for _ in range(8):
+        if mixture_cdf(hi) >= percentile:
+            break
+        hi *= 2
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        if mixture_cdf(mid) >= percentile:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
 DEFAULTS = ForecastingSettings()
 
 
@@ -87,6 +118,17 @@ class TestSelectLatestEvidence:
         assert len(ev) == 1
         assert ev[0].x == 120  # later retrieval wins
 
+    def test_latest_retrieved_at_compares_instants_not_strings(self):
+        # Lexicographically '...T10:00:00Z' > '...T10:00:00.500+00:00', but the latter is later.
+        rows = [
+            _row('2026-01-01', 100, 30, retrieved_at='2026-01-15T10:00:00Z'),
+            _row('2026-01-01', 120, 40, retrieved_at='2026-01-15T10:00:00.500+00:00'),
+        ]
+        ev = select_latest_evidence(rows)
+        assert len(ev) == 1
+        assert ev[0].x == 120
+        assert ev[0].retrieved_at == '2026-01-15T10:00:00.500+00:00'
+
     def test_multiple_anchor_days(self):
         rows = [
             _row('2026-01-01', 100, 30),
@@ -108,6 +150,20 @@ class TestSelectLatestEvidence:
         assert ev[0].x == 100
         assert ev[0].y == 25
 
+    def test_many_slice_mixture_median_matches_scalar_fit(self, monkeypatch):
+        """Batched component fitting gives the same mixture median as the scalar loop."""
+        import runner.lag_model_fitter as lmf
+        rows = [
+            _row('2026-01-01', 100, 5 + i, median_lag=2.0 + 0.5 * i, mean_lag=3.0 + 0.9 * i,
+                 slice_key=f'context(ch:c{i}).cohort()')
+            for i in range(8)
+        ]
+        monkeypatch.setattr(lmf, '_BATCH_FIT_MIN_COMPONENTS', 10**9)
+        scalar_median = select_latest_evidence(rows)[0].median_lag_days
+        monkeypatch.setattr(lmf, '_BATCH_FIT_MIN_COMPONENTS', 2)
+        batch_median = select_latest_evidence(rows)[0].median_lag_days
+        assert batch_median == pytest.approx(scalar_median, abs=1e-12)
+
     def test_empty_rows(self):
         assert select_latest_evidence([]) == []
 
@@ -115,6 +171,19 @@ class TestSelectLatestEvidence:
         rows = [{'x': 100, 'y': 30, 'retrieved_at': '2026-01-15T12:00:00Z'}]
         assert select_latest_evidence(rows) == []
 
+    def test_numeric_coercion(self):
+        rows = [_row('2026-01-01', '120', 40.9, median_lag=float('nan'), mean_lag='7.5')]
+        rows[0]['onset_delta_days'] = float('inf')
+        ev = select_latest_evidence(rows)
+        assert (ev[0].x, ev[0].y) == (120, 40)
+        assert ev[0].median_lag_days is None
+        assert ev[0].mean_lag_days == 7.5
+        assert ev[0].onset_delta_days is None
+
+    def test_non_finite_counts_treated_as_zero(self):
+        ev = select_latest_evidence([_row('2026-01-01', float('inf'), float('nan'))])
+        assert (ev[0].x, ev[0].y) == (0, 0)
+
 
 # ─────────────────────────────────────────────────────────────
 # Evidence aggregation
@@ -151,6 +220,95 @@ class TestAggregateEvidence:
         assert k == 0
 
 
+# ─────────────────────────────────────────────────────────────
+# Mixture quantile
+# ─────────────────────────────────────────────────────────────
+
+class TestMixtureQuantile:
+
+    COMPONENTS = [
+        {"weight": 40.0, "median_days": 2.0, "mean_days": 3.5},
+        {"weight": 15.0, "median_days": 9.0, "mean_days": 14.0},
+        {"weight": 5.0, "median_days": 30.0, "mean_days": None},
+    ]
+
+    @pytest.mark.parametrize("p", [0.05, 0.5, 0.95, 0.999])
+    def test_quantile_is_root_of_mixture_cdf(self, p):
+        q = _mixture_log_normal_quantile(p, self.COMPONENTS)
+        total_w = sum(c["weight"] for c in self.COMPONENTS)
+        cdf = 0.0
+        for c in self.COMPONENTS:
+            fit = fit_lag_distribution(c["median_days"], c["mean_days"], max(1, int(c["weight"])))
+            cdf += c["weight"] * log_normal_cdf(q, fit.mu, fit.sigma)
+        assert cdf / total_w == pytest.approx(p, abs=1e-10)
+
+    @pytest.mark.parametrize("p", [0.05, 0.5, 0.95])
+    def test_quantile_lies_between_component_quantiles(self, p):
+        q = _mixture_log_normal_quantile(p, self.COMPONENTS)
+        component_qs = []
+        for c in self.COMPONENTS:
+            fit = fit_lag_distribution(c["median_days"], c["mean_days"], max(1, int(c["weight"])))
+            component_qs.append(log_normal_inverse_cdf(p, fit.mu, fit.sigma))
+        assert min(component_qs) <= q <= max(component_qs)
+
+    @pytest.mark.parametrize("p", [0.05, 0.95, 0.999])
+    def test_single_component_is_root_of_cdf(self, p):
+        # FE parity: the root of the (A&S erf) CDF, as the TS bisection finds it,
+        # not the exact lognormal quantile.
+        c = self.COMPONENTS[1]
+        q = _mixture_log_normal_quantile(p, [c])
+        fit = fit_lag_distribution(c["median_days"], c["mean_days"], max(1, int(c["weight"])))
+        assert log_normal_cdf(q, fit.mu, fit.sigma) == pytest.approx(p, abs=1e-10)
+
+    # Medians spanning 1-30 days and mean/median ratios 1-3, as MECE context slices do.
+    MANY_COMPONENTS = [
+        {"weight": 5.0 + 11.0 * i, "median_days": 1.0 + 29.0 * ((7 * i) % 40) / 39,
+         "mean_days": (1.0 + 29.0 * ((7 * i) % 40) / 39) * (1.0 + (i % 9) / 4) if i % 5 else None}
+        for i in range(40)
+    ]
+
+    @pytest.mark.parametrize("p", [1e-7, 1e-4, 0.05, 0.5, 0.95, 0.999999])
+    @pytest.mark.parametrize("which", ["COMPONENTS", "MANY_COMPONENTS"])
+    def test_matches_fe_bisection(self, which, p):
+        # Tail percentiles included: there the A&S CDF is flat and quantised, and
+        # a step-size stop alone would settle short of the bisection's crossing.
+        components = getattr(self, which)
+        q = _mixture_log_normal_quantile(p, components)
+        assert q == pytest.approx(_fe_bisection_quantile(p, components), rel=1e-12)
+
+    def test_tail_plateau_matches_fe_bisection(self):
+        # At p=1e-7 this mixture's CDF is flat across ~6e-11 relative below the point where
+        # it crosses p; Newton creeps along the plateau in sub-tolerance steps.
+        components = [
+            {"weight": 190.0, "median_days": 18.0, "mean_days": 36.0},
+            {"weight": 170.0, "median_days": 4.0, "mean_days": 4.8},
+        ]
+        q = _mixture_log_normal_quantile(1e-7, components)
+        assert q == pytest.approx(_fe_bisection_quantile(1e-7, components), rel=1e-12)
+
+    # Mean/median 40 gives sigma ≈ 2.7: every component quantile at these
+    # percentiles lies outside the search range [median / 100, median * 100 * 256].
+    WIDE_COMPONENTS = [
+        {"weight": 30.0, "median_days": 10.0, "mean_days": 400.0},
+        {"weight": 70.0, "median_days": 20.0, "mean_days": 800.0},
+    ]
+
+    @pytest.mark.parametrize("p", [1e-7, 0.999999])
+    def test_all_component_quantiles_outside_search_range(self, p):
+        lo = 10.0 / 100
+        hi = 20.0 * 100 * 256
+        for c in self.WIDE_COMPONENTS:
+            fit = fit_lag_distribution(c["median_days"], c["mean_days"], max(1, int(c["weight"])))
+            q = log_normal_inverse_cdf(p, fit.mu, fit.sigma)
+            assert q < lo if p < 0.5 else q > hi
+        q = _mixture_log_normal_quantile(p, self.WIDE_COMPONENTS)
+        assert q == _fe_bisection_quantile(p, self.WIDE_COMPONENTS)
+
+    def test_invalid_percentile(self):
+        assert _mixture_log_normal_quantile(0.0, self.COMPONENTS) is None
+        assert _mixture_log_normal_quantile(1.0, self.COMPONENTS) is None
+
+
 # ─────────────────────────────────────────────────────────────
 # Full model fitting
 # ─────────────────────────────────────────────────────────────
@@ -12,6 +12,8 @@ from lib.runner.path_runner import (
     calculate_path_to_absorbing,
     compute_pruning,
     run_path_analysis,
+    PruningResult,
+    _calculate_path_probability_state_space,
 )
 
 
@@ -95,6 +97,35 @@ def build_branching_cost_mismatch_graph():
     return G
 
 
+def build_conditional_graph():
+    """
+    Graph with conditional_p on C → END (node keys differ from their human ids):
+        START → A (p=0.6) → C (p=0.5, context condition never matches)
+              → B (p=0.4) → C (p=1.0)
+        A → LOST (p=0.5), C → LOST (p=0.1)
+        C → END: visited(a) 0.9; visitedAny(b, a) 0.3; visited(b).exclude(a) 0.7; base 0.2
+    """
+    G = nx.DiGraph()
+    for hid in ('start', 'a', 'b', 'c', 'end', 'lost'):
+        G.add_node(f'uuid-{hid}', id=hid, is_entry=hid == 'start', absorbing=hid in ('end', 'lost'))
+
+    G.add_edge('uuid-start', 'uuid-a', p=0.6, cost_gbp=10, labour_cost=1)
+    G.add_edge('uuid-start', 'uuid-b', p=0.4, cost_gbp=20, labour_cost=2)
+    G.add_edge('uuid-a', 'uuid-c', p=0.5, cost_gbp=5, labour_cost=0, conditional_p=[
+        {'condition': 'context(channel:paid)', 'p': {'mean': 1.0}},
+    ])
+    G.add_edge('uuid-a', 'uuid-lost', p=0.5, cost_gbp=0, labour_cost=0)
+    G.add_edge('uuid-b', 'uuid-c', p=1.0, cost_gbp=0, labour_cost=0)
+    G.add_edge('uuid-c', 'uuid-end', p=0.2, cost_gbp=1, labour_cost=1, conditional_p=[
+        {'condition': 'visited(a)', 'p': {'mean': 0.9}},
+        {'condition': 'visitedAny(b, a)', 'p': 0.3},
+        {'condition': 'visited(b).exclude(a)', 'p': {'mean': 0.7}},
+    ])
+    G.add_edge('uuid-c', 'uuid-lost', p=0.1, cost_gbp=0, labour_cost=0)
+
+    return G
+
+
 class TestCalculatePathProbability:
     """Test basic path probability calculation."""
     
@@ -261,6 +292,17 @@ class TestPathThroughNode:
         # = 0.4 * 1.0 = 0.4
         assert result.probability == pytest.approx(0.4)
 
+    def test_through_node_reaching_several_ends(self):
+        """Probabilities and costs from the node are summed over every absorbing node."""
+        G = build_branching_cost_mismatch_graph()
+        result = calculate_path_through_node(G, 'a')
+
+        # A reaches end1 and end2 with 0.5 each; the unconditional cost from A
+        # (0.5*10 + 0.5*1010 = 510) is weighted by each end's probability.
+        assert result.probability == pytest.approx(1.0)
+        assert result.expected_cost_gbp == pytest.approx(510.0)
+        assert result.expected_labour_cost == pytest.approx(51.0)
+
 
 class TestPathToAbsorbing:
     """Test path to absorbing node analysis."""
@@ -330,6 +372,60 @@ class TestRunPathAnalysis:
         assert 'graph_stats' in result
 
 
+class TestStateSpace:
+    """Test the conditional_p state-space expansion."""
+
+    def test_most_specific_matching_condition(self):
+        """Each visited state takes its most specific matching condition."""
+        G = build_conditional_graph()
+        result = _calculate_path_probability_state_space(G, 'uuid-start', 'uuid-end')
+
+        # Via A: 0.6 * 0.5 * 0.9 (visited(a)); via B: 0.4 * 1.0 * 0.7 (visited(b).exclude(a))
+        assert result.probability == pytest.approx(0.55)
+        assert result.path_exists == True
+        # (0.27 * 16 + 0.28 * 21) / 0.55 and (0.27 * 2 + 0.28 * 3) / 0.55
+        assert result.expected_cost_gbp_given_success == pytest.approx(10.2 / 0.55)
+        assert result.expected_labour_cost_given_success == pytest.approx(1.38 / 0.55)
+
+    def test_cost_over_all_terminals(self):
+        """Unconditional cost sums over every terminal state, not just the end."""
+        G = build_conditional_graph()
+        result = _calculate_path_probability_state_space(G, 'uuid-start', 'uuid-end')
+
+        # LOST via A (0.3 @ 10), via A → C (0.03 @ 15), via B → C (0.04 @ 20), plus END
+        assert result.expected_cost_gbp == pytest.approx(3.0 + 0.45 + 0.8 + 4.32 + 5.88)
+        assert result.expected_labour_cost == pytest.approx(0.3 + 0.03 + 0.08 + 0.54 + 0.84)
+
+    def test_pruning(self):
+        """Excluded edges are skipped and renorm factors applied."""
+        G = build_conditional_graph()
+        pruning = PruningResult(
+            excluded_edges={('uuid-start', 'uuid-b')},
+            renorm_factors={('uuid-start', 'uuid-a'): 1 / 0.6},
+        )
+        result = _calculate_path_probability_state_space(G, 'uuid-start', 'uuid-end', pruning)
+
+        assert result.probability == pytest.approx(0.45)
+        assert result.expected_cost_gbp_given_success == pytest.approx(16.0)
+
+    def test_other_terminal_as_end(self):
+        """Any terminal can be the end; states reaching it are summed across visited sets."""
+        G = build_conditional_graph()
+        result = _calculate_path_probability_state_space(G, 'uuid-start', 'uuid-lost')
+
+        assert result.probability == pytest.approx(0.3 + 0.03 + 0.04)
+        assert result.expected_cost_gbp_given_success == pytest.approx(4.25 / 0.37)
+
+    def test_unreachable_end(self):
+        """An end the start cannot reach has no path."""
+        G = build_conditional_graph()
+        result = _calculate_path_probability_state_space(G, 'uuid-b', 'uuid-a')
+
+        assert result.probability == 0.0
+        assert result.path_exists == False
+        assert result.expected_cost_gbp_given_success is None
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
@@ -362,6 +458,40 @@ class TestEdgeCases:
         # Should treat missing p as 0
         assert result.probability == 0.0
 
+    def test_deep_chain(self):
+        """Long chains are not limited by the interpreter recursion depth."""
+        G = nx.DiGraph()
+        n = 5000
+        for i in range(n):
+            G.add_edge(f'n{i}', f'n{i + 1}', p=1.0, cost_gbp=1.0, labour_cost=0.0)
+
+        result = calculate_path_probability(G, 'n0', f'n{n}')
+        assert result.probability == pytest.approx(1.0)
+        assert result.expected_cost_gbp == pytest.approx(float(n))
+
+    def test_deep_chain_with_cycle(self):
+        """The cyclic fallback is not limited by the recursion depth either."""
+        G = nx.DiGraph()
+        n = 5000
+        for i in range(n):
+            G.add_edge(f'n{i}', f'n{i + 1}', p=1.0, cost_gbp=1.0, labour_cost=0.0)
+        G.add_edge(f'n{n - 1}', 'n0', p=0.0)
+
+        result = calculate_path_probability(G, 'n0', f'n{n}')
+        assert result.probability == pytest.approx(1.0)
+        assert result.expected_cost_gbp_given_success == pytest.approx(float(n))
+
+    def test_cycle_back_edge_contributes_nothing(self):
+        """A reachable cycle is cut where it re-enters a node being expanded."""
+        G = nx.DiGraph()
+        G.add_edge('a', 'b', p=1.0)
+        G.add_edge('b', 'a', p=0.5)
+        G.add_edge('b', 'end', p=0.5, cost_gbp=10.0)
+
+        result = calculate_path_probability(G, 'a', 'end')
+        assert result.probability == pytest.approx(0.5)
+        assert result.expected_cost_gbp_given_success == pytest.approx(10.0)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -201,6 +201,20 @@ class TestPathPredicates:
         # No direct edge start→c
         assert predicates['is_sequential'] == False
 
+    def test_cycle_in_selection(self):
+        """A cycle between selected nodes falls back to the unsorted selection."""
+        G = build_test_graph()
+        G.add_edge('c', 'b1', p=0.5)
+        selection = ['a', 'b1', 'c', 'end1']
+        predicates = compute_selection_predicates(G, selection)
+
+        # a is the only start and end1 the only end, but b1 ⇄ c has no topological order
+        assert predicates['has_unique_start'] == True
+        assert predicates['has_unique_end'] == True
+        assert predicates['is_sequential'] == False
+        assert predicates['sorted_nodes'] == selection
+        assert predicates['intermediate_nodes'] == []
+
 
 class TestScenarioPredicates:
     """Test scenario-related predicates."""
@@ -273,6 +287,19 @@ class TestSiblingHelpers:
         assert len(groups) == 1
         assert set(groups[0]) == {'b1', 'b2', 'b3'}
 
+    def test_find_sibling_groups_transitive(self):
+        """Nodes linked through a chain of shared parents form one group."""
+        G = build_test_graph()
+        # c's parents are b1 and b2 and end2's is b3; add b3 → c and a → end2 so that
+        # c and end2 share b3, and b2 and end2 share a. end1 (parent c) stays unrelated.
+        G.add_edge('b3', 'c', p=0.5)
+        G.add_edge('a', 'end2', p=0.1)
+
+        # b2 shares a with end2, end2 shares b3 with c: one group even though b2 and c
+        # share no parent, in selection order regardless of which node comes first.
+        assert _find_sibling_groups(G, ['c', 'b2', 'end2', 'end1']) == [['c', 'b2', 'end2'], ['end1']]
+        assert _find_sibling_groups(G, ['b2', 'c', 'end1', 'end2']) == [['b2', 'c', 'end2'], ['end1']]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])